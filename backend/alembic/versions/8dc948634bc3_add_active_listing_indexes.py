@@ -0,0 +1,42 @@
+"""add_active_listing_indexes
+
+Revision ID: 8dc948634bc3
+Revises: c1f376ae425b
+Create Date: 2026-10-15 22:58:04.512731
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8dc948634bc3'
+down_revision: Union[str, None] = 'c1f376ae425b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Partial composite indexes matching the per-user listing queries
+    # (WHERE user_pk = ? AND rm_timestamp IS NULL ORDER BY <date> DESC, pk DESC)
+    op.create_index(
+        'idx_fii_transaction_user_pk_date',
+        'fii_transaction',
+        ['user_pk', 'transaction_date', 'pk'],
+        unique=False,
+        postgresql_where=sa.text('rm_timestamp IS NULL')
+    )
+    op.create_index(
+        'idx_dividend_user_pk_payment_date',
+        'dividend',
+        ['user_pk', 'payment_date', 'pk'],
+        unique=False,
+        postgresql_where=sa.text('rm_timestamp IS NULL')
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_dividend_user_pk_payment_date', table_name='dividend')
+    op.drop_index('idx_fii_transaction_user_pk_date', table_name='fii_transaction')
@@ -7,7 +7,7 @@ from typing import Any, List
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from sqlalchemy import and_, case, func
 
 from app.api.deps import get_current_user, get_db
 from app.db.models.user import User
@@ -39,34 +39,21 @@ def _calculate_units_held(
     Returns:
         Number of units held that are eligible for dividend
     """
-    # Get all transactions up to and including COM date
-    buy_transactions = db.query(FiiTransaction).filter(
-        and_(
-            FiiTransaction.user_pk == user_pk,
-            FiiTransaction.fii_pk == fii_pk,
-            FiiTransaction.transaction_type == 'buy',
-            FiiTransaction.transaction_date <= com_date,
-            FiiTransaction.rm_timestamp.is_(None)
-        )
-    ).all()
+    # Net quantity (buys minus sells) up to and including COM date,
+    # aggregated in a single query over active transactions
+    signed_quantity = case(
+        (FiiTransaction.transaction_type == 'buy', FiiTransaction.quantity),
+        else_=-FiiTransaction.quantity
+    )
 
-    # Get all sell transactions up to and including COM date
-    sell_transactions = db.query(FiiTransaction).filter(
+    units_held = db.query(func.coalesce(func.sum(signed_quantity), 0)).filter(
         and_(
             FiiTransaction.user_pk == user_pk,
             FiiTransaction.fii_pk == fii_pk,
-            FiiTransaction.transaction_type == 'sell',
             FiiTransaction.transaction_date <= com_date,
             FiiTransaction.rm_timestamp.is_(None)
         )
-    ).all()
-
-    # Calculate total bought and sold
-    total_bought = sum(t.quantity for t in buy_transactions)
-    total_sold = sum(t.quantity for t in sell_transactions)
-
-    # Units held = bought - sold
-    units_held = total_bought - total_sold
+    ).scalar()
 
     return max(0, units_held)  # Ensure non-negative
 
@@ -226,8 +213,8 @@ def update_dividend(
         # Get update data
         update_dict = dividend_data.model_dump(exclude_unset=True)
 
-        # Verify FII exists if being updated
-        if 'fii_pk' in update_dict:
+        # Verify FII exists if being changed
+        if 'fii_pk' in update_dict and update_dict['fii_pk'] != dividend.fii_pk:
             with FiiRepository(db) as fii_repo:
                 fii = fii_repo.get_by_pk(update_dict['fii_pk'])
 
@@ -237,8 +224,8 @@ def update_dividend(
                         detail="FII not found"
                     )
 
-        # Update dividend
-        updated_dividend = dividend_repo.update(pk, DividendUpdate(**update_dict))
+        # Update the already loaded dividend
+        updated_dividend = dividend_repo.update_instance(dividend, DividendUpdate(**update_dict))
 
         return updated_dividend
 
@@ -270,13 +257,7 @@ def delete_dividend(
                 detail="Dividend not found"
             )
 
-        success = dividend_repo.delete(pk)
-
-        if not success:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Dividend not found"
-            )
+        dividend_repo.delete_instance(dividend)
 
 
 @router.get(
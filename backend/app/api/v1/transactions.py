@@ -174,8 +174,8 @@ def update_transaction(
                 detail="Transaction not found"
             )
 
-        # Verify FII exists if being updated
-        if transaction_data.fii_pk:
+        # Verify FII exists if being changed
+        if transaction_data.fii_pk and transaction_data.fii_pk != transaction.fii_pk:
             with FiiRepository(db) as fii_repo:
                 fii = fii_repo.get_by_pk(transaction_data.fii_pk)
 
@@ -185,8 +185,8 @@ def update_transaction(
                         detail="FII not found"
                     )
 
-        # Update transaction
-        updated_transaction = transaction_repo.update(pk, transaction_data)
+        # Update the already loaded transaction
+        updated_transaction = transaction_repo.update_instance(transaction, transaction_data)
 
         return updated_transaction
 
@@ -218,10 +218,4 @@ def delete_transaction(
                 detail="Transaction not found"
             )
 
-        success = transaction_repo.delete(pk)
-
-        if not success:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Transaction not found"
-            )
+        transaction_repo.delete_instance(transaction)
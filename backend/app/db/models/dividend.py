@@ -6,7 +6,7 @@ from typing import TYPE_CHECKING, Optional
 from datetime import date as date_type
 from decimal import Decimal
 
-from sqlalchemy import BigInteger, CheckConstraint, Date, ForeignKey, Integer, Numeric
+from sqlalchemy import BigInteger, CheckConstraint, Date, ForeignKey, Index, Integer, Numeric, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.models.base import BaseModel
@@ -34,6 +34,11 @@ class Dividend(BaseModel):
     __tablename__ = "dividend"
     __table_args__ = (
         CheckConstraint('amount_per_unit > 0', name='ck_dividend_amount_per_unit'),
+        Index(
+            'idx_dividend_user_pk_payment_date',
+            'user_pk', 'payment_date', 'pk',
+            postgresql_where=text('rm_timestamp IS NULL')
+        ),
         {'comment': 'Monthly dividend payment records'}
     )
 
@@ -6,7 +6,17 @@ from typing import TYPE_CHECKING
 from datetime import date as date_type
 from decimal import Decimal
 
-from sqlalchemy import BigInteger, CheckConstraint, Date, ForeignKey, Integer, Numeric, String
+from sqlalchemy import (
+    BigInteger,
+    CheckConstraint,
+    Date,
+    ForeignKey,
+    Index,
+    Integer,
+    Numeric,
+    String,
+    text,
+)
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.models.base import BaseModel
@@ -37,6 +47,11 @@ class FiiTransaction(BaseModel):
         CheckConstraint('quantity > 0', name='ck_fii_transaction_quantity'),
         CheckConstraint('price_per_unit > 0', name='ck_fii_transaction_price'),
         CheckConstraint('total_amount > 0', name='ck_fii_transaction_total'),
+        Index(
+            'idx_fii_transaction_user_pk_date',
+            'user_pk', 'transaction_date', 'pk',
+            postgresql_where=text('rm_timestamp IS NULL')
+        ),
         {'comment': 'Purchase/sale transactions'}
     )
 
@@ -112,6 +112,22 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         if not instance:
             return None
 
+        return self.update_instance(instance, schema)
+
+    def update_instance(self, instance: ModelType, schema: UpdateSchemaType) -> ModelType:
+        """
+        Generic update method for an already loaded instance.
+
+        Use when the caller has fetched the record itself (e.g. with an ownership
+        filter), to avoid loading it a second time.
+
+        Args:
+            instance: Model instance to update
+            schema: Pydantic schema instance with update data
+
+        Returns:
+            Updated model instance
+        """
         # Extract data from schema (exclude unset for PATCH semantics)
         data = schema.model_dump(exclude_unset=True)
 
@@ -145,6 +161,20 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         if not instance:
             return False
 
+        self.delete_instance(instance)
+
+        return True
+
+    def delete_instance(self, instance: ModelType) -> None:
+        """
+        Generic soft delete method for an already loaded instance.
+
+        Use when the caller has fetched the record itself (e.g. with an ownership
+        filter), to avoid loading it a second time.
+
+        Args:
+            instance: Model instance to soft delete
+        """
         # Soft delete
         instance.rm_timestamp = int(time.time())
 
@@ -154,8 +184,6 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
 
         self.session.flush()
 
-        return True
-
     def restore(self, instance: ModelType) -> ModelType:
         """
         Generic restore method - clears rm_timestamp to restore a soft-deleted record.
@@ -13,7 +13,10 @@ engine = create_engine(
 )
 
 # Create session factory
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Repositories commit on context exit, and endpoints serialize the returned
+# instances after that. Keeping them loaded avoids one SELECT per row when a
+# list endpoint's response is built.
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)
 
 
 def get_db() -> Session:
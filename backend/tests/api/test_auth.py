@@ -8,24 +8,20 @@ Tests for:
 - POST /api/v1/auth/logout - User logout
 """
 
-import pytest
-from fastapi.testclient import TestClient
-from faker import Faker
+from httpx import AsyncClient
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
+from app.core.security import verify_password
 from app.db.models.refresh_token import RefreshToken
 from app.db.models.user import User
+from tests.utils.fakers import fake
 from tests.utils.test_helpers import (
-    assert_audit_fields,
     assert_not_soft_deleted,
     assert_response_excludes_keys,
     assert_response_has_keys,
-    assert_soft_deleted,
-    create_test_user,
 )
 
-fake = Faker("pt_BR")
-
 
 # ============================================================================
 # REGISTER ENDPOINT TESTS
@@ -34,7 +30,7 @@ fake = Faker("pt_BR")
 class TestRegisterEndpoint:
     """Tests for POST /api/v1/auth/register"""
 
-    def test_register_success(self, client: TestClient, db_session: Session):
+    async def test_register_success(self, client: AsyncClient, db_session: Session):
         """Test successful user registration"""
         # Arrange
         user_data = {
@@ -45,7 +41,7 @@ class TestRegisterEndpoint:
         }
 
         # Act
-        response = client.post("/api/v1/auth/register", json=user_data)
+        response = await client.post("/api/v1/auth/register", json=user_data)
 
         # Assert
         assert response.status_code == 201
@@ -62,13 +58,13 @@ class TestRegisterEndpoint:
         assert data["is_active"] is True
 
         # Verify user created in database
-        user = db_session.query(User).filter(User.email == user_data["email"]).first()
+        user = db_session.scalars(select(User).where(User.email == user_data["email"])).first()
         assert user is not None
         assert user.email == user_data["email"]
         assert user.username == user_data["username"]
         assert_not_soft_deleted(user)
 
-    def test_register_duplicate_email(self, client: TestClient, test_user: User):
+    async def test_register_duplicate_email(self, client: AsyncClient, test_user: User):
         """Test registration with existing email fails"""
         # Arrange
         user_data = {
@@ -79,13 +75,13 @@ class TestRegisterEndpoint:
         }
 
         # Act
-        response = client.post("/api/v1/auth/register", json=user_data)
+        response = await client.post("/api/v1/auth/register", json=user_data)
 
         # Assert
         assert response.status_code == 400
         assert "email already registered" in response.json()["detail"].lower()
 
-    def test_register_duplicate_username(self, client: TestClient, test_user: User):
+    async def test_register_duplicate_username(self, client: AsyncClient, test_user: User):
         """Test registration with existing username fails"""
         # Arrange
         user_data = {
@@ -96,13 +92,13 @@ class TestRegisterEndpoint:
         }
 
         # Act
-        response = client.post("/api/v1/auth/register", json=user_data)
+        response = await client.post("/api/v1/auth/register", json=user_data)
 
         # Assert
         assert response.status_code == 400
         assert "username already taken" in response.json()["detail"].lower()
 
-    def test_register_invalid_email(self, client: TestClient):
+    async def test_register_invalid_email(self, client: AsyncClient):
         """Test registration with invalid email format"""
         # Arrange
         user_data = {
@@ -113,7 +109,7 @@ class TestRegisterEndpoint:
         }
 
         # Act
-        response = client.post("/api/v1/auth/register", json=user_data)
+        response = await client.post("/api/v1/auth/register", json=user_data)
 
         # Assert
         assert response.status_code == 422  # Validation error
@@ -126,7 +122,7 @@ class TestRegisterEndpoint:
 class TestLoginEndpoint:
     """Tests for POST /api/v1/auth/login"""
 
-    def test_login_success_with_email(self, client: TestClient, test_user: User):
+    async def test_login_success_with_email(self, client: AsyncClient, test_user: User):
         """Test login with email"""
         # Arrange
         credentials = {
@@ -135,7 +131,7 @@ class TestLoginEndpoint:
         }
 
         # Act
-        response = client.post("/api/v1/auth/login", json=credentials)
+        response = await client.post("/api/v1/auth/login", json=credentials)
 
         # Assert
         assert response.status_code == 200
@@ -149,7 +145,7 @@ class TestLoginEndpoint:
         assert len(data["access_token"]) > 0
         assert len(data["refresh_token"]) > 0
 
-    def test_login_success_with_username(self, client: TestClient, test_user: User):
+    async def test_login_success_with_username(self, client: AsyncClient, test_user: User):
         """Test login with username"""
         # Arrange
         credentials = {
@@ -158,7 +154,7 @@ class TestLoginEndpoint:
         }
 
         # Act
-        response = client.post("/api/v1/auth/login", json=credentials)
+        response = await client.post("/api/v1/auth/login", json=credentials)
 
         # Assert
         assert response.status_code == 200
@@ -168,7 +164,7 @@ class TestLoginEndpoint:
         assert_response_has_keys(data, ["access_token", "refresh_token", "token_type"])
         assert data["token_type"] == "bearer"
 
-    def test_login_wrong_password(self, client: TestClient, test_user: User):
+    async def test_login_wrong_password(self, client: AsyncClient, test_user: User):
         """Test login with incorrect password"""
         # Arrange
         credentials = {
@@ -177,13 +173,13 @@ class TestLoginEndpoint:
         }
 
         # Act
-        response = client.post("/api/v1/auth/login", json=credentials)
+        response = await client.post("/api/v1/auth/login", json=credentials)
 
         # Assert
         assert response.status_code == 401
         assert "incorrect username or password" in response.json()["detail"].lower()
 
-    def test_login_nonexistent_user(self, client: TestClient):
+    async def test_login_nonexistent_user(self, client: AsyncClient):
         """Test login with non-existent user"""
         # Arrange
         credentials = {
@@ -192,13 +188,13 @@ class TestLoginEndpoint:
         }
 
         # Act
-        response = client.post("/api/v1/auth/login", json=credentials)
+        response = await client.post("/api/v1/auth/login", json=credentials)
 
         # Assert
         assert response.status_code == 401
         assert "incorrect username or password" in response.json()["detail"].lower()
 
-    def test_login_inactive_user(self, client: TestClient, inactive_test_user: User):
+    async def test_login_inactive_user(self, client: AsyncClient, inactive_test_user: User):
         """Test login with inactive user"""
         # Arrange
         credentials = {
@@ -207,14 +203,21 @@ class TestLoginEndpoint:
         }
 
         # Act
-        response = client.post("/api/v1/auth/login", json=credentials)
+        response = await client.post("/api/v1/auth/login", json=credentials)
 
         # Assert
         assert response.status_code == 400
         assert "inactive user" in response.json()["detail"].lower()
 
-    def test_login_creates_refresh_token(
-        self, client: TestClient, test_user: User, db_session: Session
+    def test_password_verify_still_works(self, test_user: User, inactive_test_user: User):
+        """Test that the shared cached fixture hash verifies for each user"""
+        # Assert
+        assert inactive_test_user.hashed_password == test_user.hashed_password
+        assert verify_password(test_user.plain_password, test_user.hashed_password)  # type: ignore
+        assert not verify_password("wrongpassword", test_user.hashed_password)
+
+    async def test_login_creates_refresh_token(
+        self, client: AsyncClient, test_user: User, db_session: Session
     ):
         """Test that login creates refresh token in database"""
         # Arrange
@@ -224,7 +227,7 @@ class TestLoginEndpoint:
         }
 
         # Act
-        response = client.post("/api/v1/auth/login", json=credentials)
+        response = await client.post("/api/v1/auth/login", json=credentials)
 
         # Assert
         assert response.status_code == 200
@@ -232,11 +235,9 @@ class TestLoginEndpoint:
         refresh_token_str = data["refresh_token"]
 
         # Verify refresh token in database
-        refresh_token = (
-            db_session.query(RefreshToken)
-            .filter(RefreshToken.token == refresh_token_str)
-            .first()
-        )
+        refresh_token = db_session.scalars(
+            select(RefreshToken).where(RefreshToken.token == refresh_token_str)
+        ).first()
         assert refresh_token is not None
         assert refresh_token.user_pk == test_user.pk
         assert_not_soft_deleted(refresh_token)
@@ -249,8 +250,8 @@ class TestLoginEndpoint:
 class TestRefreshEndpoint:
     """Tests for POST /api/v1/auth/refresh"""
 
-    def test_refresh_success(
-        self, client: TestClient, test_user_refresh_token: RefreshToken
+    async def test_refresh_success(
+        self, client: AsyncClient, test_user_refresh_token: RefreshToken
     ):
         """Test successful token refresh"""
         # Arrange
@@ -259,7 +260,7 @@ class TestRefreshEndpoint:
         }
 
         # Act
-        response = client.post("/api/v1/auth/refresh", json=request_data)
+        response = await client.post("/api/v1/auth/refresh", json=request_data)
 
         # Assert
         assert response.status_code == 200
@@ -274,9 +275,9 @@ class TestRefreshEndpoint:
         # New tokens should be different
         assert data["refresh_token"] != test_user_refresh_token.token_str  # type: ignore
 
-    def test_refresh_revokes_old_token(
+    async def test_refresh_revokes_old_token(
         self,
-        client: TestClient,
+        client: AsyncClient,
         test_user_refresh_token: RefreshToken,
         db_session: Session,
     ):
@@ -288,20 +289,22 @@ class TestRefreshEndpoint:
         }
 
         # Act
-        response = client.post("/api/v1/auth/refresh", json=request_data)
+        response = await client.post("/api/v1/auth/refresh", json=request_data)
 
         # Assert
         assert response.status_code == 200
 
         # Verify old token is soft deleted
         db_session.expire_all()  # Force reload from database
-        old_token = db_session.query(RefreshToken).filter(
-            RefreshToken.pk == old_token_pk,
-            RefreshToken.rm_timestamp.is_(None),
+        old_token = db_session.scalars(
+            select(RefreshToken).where(
+                RefreshToken.pk == old_token_pk,
+                RefreshToken.rm_timestamp.is_(None),
+            )
         ).first()
         assert old_token is None  # Should not be found (soft deleted)
 
-    def test_refresh_invalid_token(self, client: TestClient):
+    async def test_refresh_invalid_token(self, client: AsyncClient):
         """Test refresh with invalid token"""
         # Arrange
         request_data = {
@@ -309,13 +312,13 @@ class TestRefreshEndpoint:
         }
 
         # Act
-        response = client.post("/api/v1/auth/refresh", json=request_data)
+        response = await client.post("/api/v1/auth/refresh", json=request_data)
 
         # Assert
         assert response.status_code == 401
         assert "invalid refresh token" in response.json()["detail"].lower()
 
-    def test_refresh_nonexistent_token(self, client: TestClient):
+    async def test_refresh_nonexistent_token(self, client: AsyncClient):
         """Test refresh with non-existent token"""
         # Arrange
         # Create a valid JWT structure but not in database
@@ -327,7 +330,7 @@ class TestRefreshEndpoint:
         }
 
         # Act
-        response = client.post("/api/v1/auth/refresh", json=request_data)
+        response = await client.post("/api/v1/auth/refresh", json=request_data)
 
         # Assert
         assert response.status_code == 401
@@ -340,9 +343,9 @@ class TestRefreshEndpoint:
 class TestLogoutEndpoint:
     """Tests for POST /api/v1/auth/logout"""
 
-    def test_logout_success(
+    async def test_logout_success(
         self,
-        client: TestClient,
+        client: AsyncClient,
         test_user_refresh_token: RefreshToken,
         db_session: Session,
     ):
@@ -354,7 +357,7 @@ class TestLogoutEndpoint:
         }
 
         # Act
-        response = client.post("/api/v1/auth/logout", json=request_data)
+        response = await client.post("/api/v1/auth/logout", json=request_data)
 
         # Assert
         assert response.status_code == 204
@@ -362,13 +365,15 @@ class TestLogoutEndpoint:
 
         # Verify refresh token is soft deleted
         db_session.expire_all()  # Force reload from database
-        token = db_session.query(RefreshToken).filter(
-            RefreshToken.pk == token_pk,
-            RefreshToken.rm_timestamp.is_(None),
+        token = db_session.scalars(
+            select(RefreshToken).where(
+                RefreshToken.pk == token_pk,
+                RefreshToken.rm_timestamp.is_(None),
+            )
         ).first()
         assert token is None  # Should not be found (soft deleted)
 
-    def test_logout_invalid_token(self, client: TestClient):
+    async def test_logout_invalid_token(self, client: AsyncClient):
         """Test logout with invalid token (should still succeed)"""
         # Arrange
         request_data = {
@@ -376,13 +381,13 @@ class TestLogoutEndpoint:
         }
 
         # Act
-        response = client.post("/api/v1/auth/logout", json=request_data)
+        response = await client.post("/api/v1/auth/logout", json=request_data)
 
         # Assert
         # Logout should succeed even with invalid token (idempotent)
         assert response.status_code == 204
 
-    def test_logout_nonexistent_token(self, client: TestClient):
+    async def test_logout_nonexistent_token(self, client: AsyncClient):
         """Test logout with non-existent token (should still succeed)"""
         # Arrange
         from app.core.security import create_refresh_token
@@ -393,7 +398,7 @@ class TestLogoutEndpoint:
         }
 
         # Act
-        response = client.post("/api/v1/auth/logout", json=request_data)
+        response = await client.post("/api/v1/auth/logout", json=request_data)
 
         # Assert
         # Logout should succeed even if token doesn't exist (idempotent)
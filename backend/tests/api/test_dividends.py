@@ -7,29 +7,31 @@ Tests for:
 - GET /api/v1/dividends/{pk} - Get single dividend
 - PATCH /api/v1/dividends/{pk} - Update dividend
 - DELETE /api/v1/dividends/{pk} - Soft delete dividend
+- GET /api/v1/dividends/summary/monthly - Monthly dividend summary
 """
 
-import pytest
 from datetime import date, timedelta
 from decimal import Decimal
-from fastapi.testclient import TestClient
-from faker import Faker
+from httpx import AsyncClient
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from app.db.models.dividend import Dividend
 from app.db.models.fii import Fii
 from app.db.models.user import User
+from app.schemas.dividend import DividendResponse, MonthlySummaryResponse
 from tests.utils.test_helpers import (
+    QueryCounter,
     assert_audit_fields,
     assert_list_contains_only,
     assert_not_soft_deleted,
     assert_pagination_params,
-    assert_response_has_keys,
-    assert_soft_deleted,
+    assert_valid_list,
+    create_test_dividend,
+    create_test_fii,
+    create_test_transaction,
 )
 
-fake = Faker("pt_BR")
-
 
 # ============================================================================
 # CREATE DIVIDEND ENDPOINT TESTS
@@ -38,9 +40,9 @@ fake = Faker("pt_BR")
 class TestCreateDividend:
     """Tests for POST /api/v1/dividends/"""
 
-    def test_create_dividend_success(
+    async def test_create_dividend_success(
         self,
-        authenticated_client: TestClient,
+        authenticated_client: AsyncClient,
         test_fii: Fii,
         test_user: User,
         db_session: Session,
@@ -54,23 +56,14 @@ class TestCreateDividend:
         }
 
         # Act
-        response = authenticated_client.post("/api/v1/dividends/", json=dividend_data)
+        response = await authenticated_client.post("/api/v1/dividends/", json=dividend_data)
 
         # Assert
         assert response.status_code == 201
         data = response.json()
 
         # Verify response structure
-        assert_response_has_keys(
-            data,
-            [
-                "pk",
-                "user_pk",
-                "fii_pk",
-                "payment_date",
-                "amount_per_unit",
-            ],
-        )
+        DividendResponse.model_validate(data)
 
         # Verify response values
         assert data["user_pk"] == test_user.pk  # Automatically set
@@ -78,13 +71,13 @@ class TestCreateDividend:
         assert Decimal(data["amount_per_unit"]) == Decimal(dividend_data["amount_per_unit"])
 
         # Verify dividend created in database
-        dividend = db_session.query(Dividend).filter(Dividend.pk == data["pk"]).first()
+        dividend = db_session.scalars(select(Dividend).where(Dividend.pk == data["pk"])).first()
         assert dividend is not None
         assert dividend.user_pk == test_user.pk
         assert_not_soft_deleted(dividend)
         assert_audit_fields(dividend, created_by_pk=test_user.pk)
 
-    def test_create_dividend_invalid_fii(self, authenticated_client: TestClient):
+    async def test_create_dividend_invalid_fii(self, authenticated_client: AsyncClient):
         """Test creating dividend with non-existent FII"""
         # Arrange
         dividend_data = {
@@ -96,23 +89,23 @@ class TestCreateDividend:
         }
 
         # Act
-        response = authenticated_client.post("/api/v1/dividends/", json=dividend_data)
+        response = await authenticated_client.post("/api/v1/dividends/", json=dividend_data)
 
         # Assert
         assert response.status_code == 404
         assert "not found" in response.json()["detail"].lower()
 
-    def test_create_dividend_unauthenticated(self, client: TestClient, test_fii: Fii):
+    async def test_create_dividend_unauthenticated(self, client: AsyncClient):
         """Test creating dividend without authentication"""
         # Arrange
         dividend_data = {
-            "fii_pk": test_fii.pk,
+            "fii_pk": 1,
             "payment_date": str(date.today() - timedelta(days=15)),
             "amount_per_unit": "0.85",
         }
 
         # Act
-        response = client.post("/api/v1/dividends/", json=dividend_data)
+        response = await client.post("/api/v1/dividends/", json=dividend_data)
 
         # Assert
         assert response.status_code == 403
@@ -125,34 +118,34 @@ class TestCreateDividend:
 class TestListDividends:
     """Tests for GET /api/v1/dividends/"""
 
-    def test_list_dividends_success(
-        self, authenticated_client: TestClient, test_dividend: Dividend
+    async def test_list_dividends_success(
+        self, authenticated_client: AsyncClient, test_dividend: Dividend
     ):
         """Test listing user's dividends"""
         # Act
-        response = authenticated_client.get("/api/v1/dividends/")
+        response = await authenticated_client.get("/api/v1/dividends/")
 
         # Assert
         assert response.status_code == 200
         data = response.json()
 
-        # Verify response is a list
-        assert isinstance(data, list)
+        # Verify response is a list of valid items
+        assert_valid_list(data, DividendResponse)
         assert len(data) >= 1
 
         # Verify dividend is in list
         dividend_pks = [d["pk"] for d in data]
         assert test_dividend.pk in dividend_pks
 
-    def test_list_dividends_only_own(
+    async def test_list_dividends_only_own(
         self,
-        authenticated_client: TestClient,
+        authenticated_client: AsyncClient,
         test_dividend: Dividend,
         other_user_dividend: Dividend,
     ):
         """Test user can only see their own dividends"""
         # Act
-        response = authenticated_client.get("/api/v1/dividends/")
+        response = await authenticated_client.get("/api/v1/dividends/")
 
         # Assert
         assert response.status_code == 200
@@ -165,15 +158,15 @@ class TestListDividends:
         # Other user's dividend should NOT be in list
         assert other_user_dividend.pk not in dividend_pks
 
-    def test_list_dividends_filter_by_fii(
-        self, authenticated_client: TestClient, dividends_multiple_fiis: dict
+    async def test_list_dividends_filter_by_fii(
+        self, authenticated_client: AsyncClient, dividends_multiple_fiis: dict
     ):
         """Test filtering by FII"""
         # Arrange
         fii_pk = list(dividends_multiple_fiis.keys())[0]
 
         # Act
-        response = authenticated_client.get(f"/api/v1/dividends/?fii_pk={fii_pk}")
+        response = await authenticated_client.get(f"/api/v1/dividends/?fii_pk={fii_pk}")
 
         # Assert
         assert response.status_code == 200
@@ -183,8 +176,8 @@ class TestListDividends:
         assert len(data) >= 2
         assert_list_contains_only(data, "fii_pk", fii_pk)
 
-    def test_list_dividends_filter_by_date_range(
-        self, authenticated_client: TestClient, dividends_various_dates: list[Dividend]
+    async def test_list_dividends_filter_by_date_range(
+        self, authenticated_client: AsyncClient, dividends_various_dates: list[Dividend]
     ):
         """Test filtering by date range"""
         # Arrange
@@ -192,7 +185,7 @@ class TestListDividends:
         end_date = date.today() - timedelta(days=30)
 
         # Act
-        response = authenticated_client.get(
+        response = await authenticated_client.get(
             f"/api/v1/dividends/?start_date={start_date}&end_date={end_date}"
         )
 
@@ -205,26 +198,47 @@ class TestListDividends:
             payment_date = date.fromisoformat(dividend["payment_date"])
             assert start_date <= payment_date <= end_date
 
-    def test_list_dividends_pagination(
-        self, authenticated_client: TestClient, many_dividends: list[Dividend]
+    async def test_list_dividends_pagination(
+        self, authenticated_client: AsyncClient, many_dividends: list[Dividend]
     ):
         """Test pagination"""
         # Test limit
-        response = authenticated_client.get("/api/v1/dividends/?skip=0&limit=5")
+        response = await authenticated_client.get("/api/v1/dividends/?skip=0&limit=5")
         assert response.status_code == 200
         data = response.json()
         assert_pagination_params(data, 5)
 
         # Test skip
-        response = authenticated_client.get("/api/v1/dividends/?skip=5&limit=5")
+        response = await authenticated_client.get("/api/v1/dividends/?skip=5&limit=5")
         assert response.status_code == 200
         data = response.json()
         assert_pagination_params(data, 5)
 
-    def test_list_dividends_unauthenticated(self, client: TestClient):
+    async def test_list_dividends_query_count(
+        self,
+        authenticated_client: AsyncClient,
+        many_dividends: list[Dividend],
+        query_counter: QueryCounter,
+    ):
+        """Test the list costs a fixed number of queries, whatever the page size"""
+        counts = []
+        for limit in (2, 10):
+            # Act
+            with query_counter:
+                response = await authenticated_client.get(f"/api/v1/dividends/?limit={limit}")
+
+            # Assert
+            assert response.status_code == 200
+            assert len(response.json()) == limit
+            counts.append(query_counter.count)
+
+        # auth (user, roles, RLS SET), list
+        assert counts == [4, 4]
+
+    async def test_list_dividends_unauthenticated(self, client: AsyncClient):
         """Test listing dividends without authentication"""
         # Act
-        response = client.get("/api/v1/dividends/")
+        response = await client.get("/api/v1/dividends/")
 
         # Assert
         assert response.status_code == 403
@@ -237,58 +251,47 @@ class TestListDividends:
 class TestGetDividend:
     """Tests for GET /api/v1/dividends/{pk}"""
 
-    def test_get_dividend_success(
-        self, authenticated_client: TestClient, test_dividend: Dividend
+    async def test_get_dividend_success(
+        self, authenticated_client: AsyncClient, test_dividend: Dividend
     ):
         """Test retrieving single dividend"""
         # Act
-        response = authenticated_client.get(f"/api/v1/dividends/{test_dividend.pk}")
+        response = await authenticated_client.get(f"/api/v1/dividends/{test_dividend.pk}")
 
         # Assert
         assert response.status_code == 200
         data = response.json()
 
         # Verify response structure
-        assert_response_has_keys(
-            data,
-            [
-                "pk",
-                "user_pk",
-                "fii_pk",
-                "payment_date",
-                "amount_per_unit",
-            ],
-        )
+        DividendResponse.model_validate(data)
 
         # Verify response values
         assert data["pk"] == test_dividend.pk
         assert data["fii_pk"] == test_dividend.fii_pk
 
-    def test_get_dividend_not_own(
-        self, authenticated_client: TestClient, other_user_dividend: Dividend
+    async def test_get_dividend_not_own(
+        self, authenticated_client: AsyncClient, other_user_dividend: Dividend
     ):
         """Test retrieving another user's dividend (ownership enforcement)"""
         # Act
-        response = authenticated_client.get(f"/api/v1/dividends/{other_user_dividend.pk}")
+        response = await authenticated_client.get(f"/api/v1/dividends/{other_user_dividend.pk}")
 
         # Assert
         assert response.status_code == 404
         assert "not found" in response.json()["detail"].lower()
 
-    def test_get_dividend_not_found(self, authenticated_client: TestClient):
+    async def test_get_dividend_not_found(self, authenticated_client: AsyncClient):
         """Test retrieving non-existent dividend"""
         # Act
-        response = authenticated_client.get("/api/v1/dividends/99999")
+        response = await authenticated_client.get("/api/v1/dividends/99999")
 
         # Assert
         assert response.status_code == 404
 
-    def test_get_dividend_unauthenticated(
-        self, client: TestClient, test_dividend: Dividend
-    ):
+    async def test_get_dividend_unauthenticated(self, client: AsyncClient):
         """Test retrieving dividend without authentication"""
         # Act
-        response = client.get(f"/api/v1/dividends/{test_dividend.pk}")
+        response = await client.get("/api/v1/dividends/1")
 
         # Assert
         assert response.status_code == 403
@@ -301,9 +304,9 @@ class TestGetDividend:
 class TestUpdateDividend:
     """Tests for PATCH /api/v1/dividends/{pk}"""
 
-    def test_update_dividend_success(
+    async def test_update_dividend_success(
         self,
-        authenticated_client: TestClient,
+        authenticated_client: AsyncClient,
         test_dividend: Dividend,
         test_user: User,
         db_session: Session,
@@ -314,7 +317,7 @@ class TestUpdateDividend:
         }
 
         # Act
-        response = authenticated_client.patch(
+        response = await authenticated_client.patch(
             f"/api/v1/dividends/{test_dividend.pk}", json=update_data
         )
 
@@ -325,11 +328,13 @@ class TestUpdateDividend:
         # Verify response values
 
         # Verify updated in database
-        db_session.refresh(test_dividend)
-        assert test_dividend.updated_by_pk == test_user.pk
+        updated_by_pk = db_session.scalar(
+            select(Dividend.updated_by_pk).where(Dividend.pk == test_dividend.pk)
+        )
+        assert updated_by_pk == test_user.pk
 
-    def test_update_dividend_not_own(
-        self, authenticated_client: TestClient, other_user_dividend: Dividend
+    async def test_update_dividend_not_own(
+        self, authenticated_client: AsyncClient, other_user_dividend: Dividend
     ):
         """Test updating another user's dividend"""
         # Arrange
@@ -337,15 +342,15 @@ class TestUpdateDividend:
         }
 
         # Act
-        response = authenticated_client.patch(
+        response = await authenticated_client.patch(
             f"/api/v1/dividends/{other_user_dividend.pk}", json=update_data
         )
 
         # Assert
         assert response.status_code == 404
 
-    def test_update_dividend_invalid_fii(
-        self, authenticated_client: TestClient, test_dividend: Dividend
+    async def test_update_dividend_invalid_fii(
+        self, authenticated_client: AsyncClient, test_dividend: Dividend
     ):
         """Test updating with invalid FII"""
         # Arrange
@@ -354,7 +359,7 @@ class TestUpdateDividend:
         }
 
         # Act
-        response = authenticated_client.patch(
+        response = await authenticated_client.patch(
             f"/api/v1/dividends/{test_dividend.pk}", json=update_data
         )
 
@@ -362,16 +367,14 @@ class TestUpdateDividend:
         assert response.status_code == 404
         assert "not found" in response.json()["detail"].lower()
 
-    def test_update_dividend_unauthenticated(
-        self, client: TestClient, test_dividend: Dividend
-    ):
+    async def test_update_dividend_unauthenticated(self, client: AsyncClient):
         """Test updating dividend without authentication"""
         # Arrange
         update_data = {
         }
 
         # Act
-        response = client.patch(f"/api/v1/dividends/{test_dividend.pk}", json=update_data)
+        response = await client.patch("/api/v1/dividends/1", json=update_data)
 
         # Assert
         assert response.status_code == 403
@@ -384,9 +387,9 @@ class TestUpdateDividend:
 class TestDeleteDividend:
     """Tests for DELETE /api/v1/dividends/{pk}"""
 
-    def test_delete_dividend_success(
+    async def test_delete_dividend_success(
         self,
-        authenticated_client: TestClient,
+        authenticated_client: AsyncClient,
         test_dividend: Dividend,
         test_user: User,
         db_session: Session,
@@ -396,50 +399,166 @@ class TestDeleteDividend:
         dividend_pk = test_dividend.pk
 
         # Act
-        response = authenticated_client.delete(f"/api/v1/dividends/{dividend_pk}")
+        response = await authenticated_client.delete(f"/api/v1/dividends/{dividend_pk}")
 
         # Assert
         assert response.status_code == 204
         assert response.content == b""
 
-        # Verify soft deleted in database
-        db_session.expire_all()  # Force reload from database
-        dividend = db_session.query(Dividend).filter(
-            Dividend.pk == dividend_pk, Dividend.rm_timestamp.is_(None)
-        ).first()
-        assert dividend is None  # Should not be found (soft deleted)
-
-        # Verify with include_deleted
-        dividend_with_deleted = db_session.query(Dividend).filter(
-            Dividend.pk == dividend_pk
-        ).first()
-        assert dividend_with_deleted is not None
-        assert_soft_deleted(dividend_with_deleted)
-
-    def test_delete_dividend_not_own(
-        self, authenticated_client: TestClient, other_user_dividend: Dividend
+        # Verify soft deleted in database (row still exists, rm_timestamp set)
+        row = db_session.execute(
+            select(Dividend.pk, Dividend.rm_timestamp).where(Dividend.pk == dividend_pk)
+        ).one_or_none()
+        assert row is not None
+        assert row.rm_timestamp is not None
+
+    async def test_delete_dividend_not_own(
+        self, authenticated_client: AsyncClient, other_user_dividend: Dividend
     ):
         """Test deleting another user's dividend"""
         # Act
-        response = authenticated_client.delete(f"/api/v1/dividends/{other_user_dividend.pk}")
+        response = await authenticated_client.delete(f"/api/v1/dividends/{other_user_dividend.pk}")
 
         # Assert
         assert response.status_code == 404
 
-    def test_delete_dividend_not_found(self, authenticated_client: TestClient):
+    async def test_delete_dividend_not_found(self, authenticated_client: AsyncClient):
         """Test deleting non-existent dividend"""
         # Act
-        response = authenticated_client.delete("/api/v1/dividends/99999")
+        response = await authenticated_client.delete("/api/v1/dividends/99999")
 
         # Assert
         assert response.status_code == 404
 
-    def test_delete_dividend_unauthenticated(
-        self, client: TestClient, test_dividend: Dividend
-    ):
+    async def test_delete_dividend_unauthenticated(self, client: AsyncClient):
         """Test deleting dividend without authentication"""
         # Act
-        response = client.delete(f"/api/v1/dividends/{test_dividend.pk}")
+        response = await client.delete("/api/v1/dividends/1")
+
+        # Assert
+        assert response.status_code == 403
+
+
+# ============================================================================
+# MONTHLY SUMMARY ENDPOINT TESTS
+# ============================================================================
+
+SUMMARY_COM_DATE = date(2024, 3, 10)
+SUMMARY_PAYMENT_DATE = date(2024, 3, 15)
+
+
+class TestMonthlySummary:
+    """Tests for GET /api/v1/dividends/summary/monthly"""
+
+    async def _get_fii_summary(self, authenticated_client: AsyncClient, fii: Fii) -> dict:
+        """Request the March 2024 summary and return the entry for `fii`."""
+        response = await authenticated_client.get(
+            "/api/v1/dividends/summary/monthly", params={"year": 2024, "month": 3}
+        )
+        assert response.status_code == 200
+        data = response.json()
+        MonthlySummaryResponse.model_validate(data)
+
+        return next(entry for entry in data["fiis"] if entry["fii_pk"] == fii.pk)
+
+    async def test_monthly_summary_units_held(
+        self,
+        authenticated_client: AsyncClient,
+        test_user: User,
+        another_test_user: User,
+        db_session: Session,
+    ):
+        """Test units held nets buys and sells up to and including the COM date"""
+        # Arrange
+        fii = create_test_fii(db_session, test_user.pk)
+        for transaction_type, quantity, transaction_date in [
+            ("buy", 100, date(2024, 1, 5)),
+            ("sell", 30, date(2024, 2, 1)),
+            ("buy", 50, SUMMARY_COM_DATE),  # on the COM date: eligible
+            ("buy", 1000, SUMMARY_COM_DATE + timedelta(days=1)),  # after COM date: ignored
+        ]:
+            create_test_transaction(
+                db_session,
+                test_user.pk,
+                fii.pk,
+                transaction_type=transaction_type,
+                quantity=quantity,
+                transaction_date=transaction_date,
+            )
+        # Soft-deleted transaction: ignored
+        create_test_transaction(
+            db_session,
+            test_user.pk,
+            fii.pk,
+            quantity=500,
+            transaction_date=date(2024, 2, 15),
+            rm_timestamp=1,
+        )
+        # Another user's transaction on the same FII: ignored
+        create_test_transaction(
+            db_session,
+            another_test_user.pk,
+            fii.pk,
+            quantity=700,
+            transaction_date=date(2024, 1, 5),
+        )
+        create_test_dividend(
+            db_session,
+            test_user.pk,
+            fii.pk,
+            payment_date=SUMMARY_PAYMENT_DATE,
+            com_date=SUMMARY_COM_DATE,
+            amount_per_unit=Decimal("0.50"),
+        )
+
+        # Act
+        summary = await self._get_fii_summary(authenticated_client, fii)
+
+        # Assert
+        assert summary["dividend_count"] == 1
+        assert summary["dividends"][0]["units_held"] == 120
+        assert Decimal(summary["dividends"][0]["total_amount"]) == Decimal("60.00")
+        assert Decimal(summary["total_amount"]) == Decimal("60.00")
+
+    async def test_monthly_summary_units_held_clamped_at_zero(
+        self, authenticated_client: AsyncClient, test_user: User, db_session: Session
+    ):
+        """Test more units sold than bought before the COM date counts as zero held"""
+        # Arrange
+        fii = create_test_fii(db_session, test_user.pk)
+        create_test_transaction(
+            db_session, test_user.pk, fii.pk, quantity=10, transaction_date=date(2024, 1, 5)
+        )
+        create_test_transaction(
+            db_session,
+            test_user.pk,
+            fii.pk,
+            transaction_type="sell",
+            quantity=30,
+            transaction_date=date(2024, 2, 1),
+        )
+        create_test_dividend(
+            db_session,
+            test_user.pk,
+            fii.pk,
+            payment_date=SUMMARY_PAYMENT_DATE,
+            com_date=SUMMARY_COM_DATE,
+            amount_per_unit=Decimal("0.50"),
+        )
+
+        # Act
+        summary = await self._get_fii_summary(authenticated_client, fii)
+
+        # Assert
+        assert summary["dividends"][0]["units_held"] == 0
+        assert Decimal(summary["total_amount"]) == Decimal("0")
+
+    async def test_monthly_summary_unauthenticated(self, client: AsyncClient):
+        """Test monthly summary without authentication"""
+        # Act
+        response = await client.get(
+            "/api/v1/dividends/summary/monthly", params={"year": 2024, "month": 3}
+        )
 
         # Assert
         assert response.status_code == 403
@@ -9,25 +9,22 @@ Tests for:
 - DELETE /api/v1/fiis/{pk} - Soft delete FII
 """
 
-import pytest
-from decimal import Decimal
-from fastapi.testclient import TestClient
-from faker import Faker
+from httpx import AsyncClient
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from app.db.models.fii import Fii
 from app.db.models.user import User
+from app.schemas.fii import FiiResponse
 from tests.utils.test_helpers import (
+    QueryCounter,
     assert_audit_fields,
     assert_list_contains_only,
     assert_not_soft_deleted,
     assert_pagination_params,
-    assert_response_has_keys,
-    assert_soft_deleted,
+    assert_valid_list,
 )
 
-fake = Faker("pt_BR")
-
 
 # ============================================================================
 # CREATE FII ENDPOINT TESTS
@@ -36,8 +33,8 @@ fake = Faker("pt_BR")
 class TestCreateFii:
     """Tests for POST /api/v1/fiis/"""
 
-    def test_create_fii_success(
-        self, authenticated_client: TestClient, test_user: User, db_session: Session
+    async def test_create_fii_success(
+        self, authenticated_client: AsyncClient, test_user: User, db_session: Session
     ):
         """Test successful FII creation"""
         # Arrange
@@ -48,16 +45,14 @@ class TestCreateFii:
         }
 
         # Act
-        response = authenticated_client.post("/api/v1/fiis/", json=fii_data)
+        response = await authenticated_client.post("/api/v1/fiis/", json=fii_data)
 
         # Assert
         assert response.status_code == 201
         data = response.json()
 
         # Verify response structure
-        assert_response_has_keys(
-            data, ["pk", "tag", "name", "sector", "created_at", "updated_at"]
-        )
+        FiiResponse.model_validate(data)
 
         # Verify response values
         assert data["tag"] == fii_data["tag"]
@@ -65,13 +60,13 @@ class TestCreateFii:
         assert data["sector"] == fii_data["sector"]
 
         # Verify FII created in database
-        fii = db_session.query(Fii).filter(Fii.tag == fii_data["tag"]).first()
+        fii = db_session.scalars(select(Fii).where(Fii.tag == fii_data["tag"])).first()
         assert fii is not None
         assert_not_soft_deleted(fii)
         assert_audit_fields(fii, created_by_pk=test_user.pk)
 
-    def test_create_fii_tag_normalized(
-        self, authenticated_client: TestClient, db_session: Session
+    async def test_create_fii_tag_normalized(
+        self, authenticated_client: AsyncClient, db_session: Session
     ):
         """Test FII tag is uppercase normalized"""
         # Arrange
@@ -82,7 +77,7 @@ class TestCreateFii:
         }
 
         # Act
-        response = authenticated_client.post("/api/v1/fiis/", json=fii_data)
+        response = await authenticated_client.post("/api/v1/fiis/", json=fii_data)
 
         # Assert
         assert response.status_code == 201
@@ -90,11 +85,11 @@ class TestCreateFii:
         assert data["tag"] == "HGLG11"  # Uppercase
 
         # Verify in database
-        fii = db_session.query(Fii).filter(Fii.tag == "HGLG11").first()
+        fii = db_session.scalars(select(Fii).where(Fii.tag == "HGLG11")).first()
         assert fii is not None
 
-    def test_create_fii_duplicate_tag(
-        self, authenticated_client: TestClient, test_fii: Fii
+    async def test_create_fii_duplicate_tag(
+        self, authenticated_client: AsyncClient, test_fii: Fii
     ):
         """Test creating FII with duplicate tag fails"""
         # Arrange
@@ -105,13 +100,13 @@ class TestCreateFii:
         }
 
         # Act
-        response = authenticated_client.post("/api/v1/fiis/", json=fii_data)
+        response = await authenticated_client.post("/api/v1/fiis/", json=fii_data)
 
         # Assert
         assert response.status_code == 400
         assert "already exists" in response.json()["detail"].lower()
 
-    def test_create_fii_unauthenticated(self, client: TestClient):
+    async def test_create_fii_unauthenticated(self, client: AsyncClient):
         """Test creating FII without authentication"""
         # Arrange
         fii_data = {
@@ -121,7 +116,7 @@ class TestCreateFii:
         }
 
         # Act
-        response = client.post("/api/v1/fiis/", json=fii_data)
+        response = await client.post("/api/v1/fiis/", json=fii_data)
 
         # Assert
         assert response.status_code == 403
@@ -134,47 +129,47 @@ class TestCreateFii:
 class TestListFiis:
     """Tests for GET /api/v1/fiis/"""
 
-    def test_list_fiis_success(
-        self, authenticated_client: TestClient, test_fii: Fii
+    async def test_list_fiis_success(
+        self, authenticated_client: AsyncClient, test_fii: Fii
     ):
         """Test listing FIIs"""
         # Act
-        response = authenticated_client.get("/api/v1/fiis/")
+        response = await authenticated_client.get("/api/v1/fiis/")
 
         # Assert
         assert response.status_code == 200
         data = response.json()
 
-        # Verify response is a list
-        assert isinstance(data, list)
+        # Verify response is a list of valid items
+        assert_valid_list(data, FiiResponse)
         assert len(data) >= 1
 
         # Verify FII is in list
         fii_tags = [fii["tag"] for fii in data]
         assert test_fii.tag in fii_tags
 
-    def test_list_fiis_pagination(
-        self, authenticated_client: TestClient, multiple_test_fiis: list[Fii]
+    async def test_list_fiis_pagination(
+        self, authenticated_client: AsyncClient, multiple_test_fiis: list[Fii]
     ):
         """Test FII list pagination"""
         # Test skip parameter
-        response = authenticated_client.get("/api/v1/fiis/?skip=0&limit=5")
+        response = await authenticated_client.get("/api/v1/fiis/?skip=0&limit=5")
         assert response.status_code == 200
         data = response.json()
         assert_pagination_params(data, 5)
 
         # Test limit parameter
-        response = authenticated_client.get("/api/v1/fiis/?skip=5&limit=3")
+        response = await authenticated_client.get("/api/v1/fiis/?skip=5&limit=3")
         assert response.status_code == 200
         data = response.json()
         assert_pagination_params(data, 3)
 
-    def test_list_fiis_filter_by_sector(
-        self, authenticated_client: TestClient, fiis_multiple_sectors: dict
+    async def test_list_fiis_filter_by_sector(
+        self, authenticated_client: AsyncClient, fiis_multiple_sectors: dict
     ):
         """Test filtering FIIs by sector"""
         # Act - Filter by Logística
-        response = authenticated_client.get("/api/v1/fiis/?sector=Logística")
+        response = await authenticated_client.get("/api/v1/fiis/?sector=Logística")
 
         # Assert
         assert response.status_code == 200
@@ -184,12 +179,12 @@ class TestListFiis:
         assert len(data) >= 2
         assert_list_contains_only(data, "sector", "Logística")
 
-    def test_list_fiis_excludes_soft_deleted(
-        self, authenticated_client: TestClient, test_fii: Fii, deleted_test_fii: Fii
+    async def test_list_fiis_excludes_soft_deleted(
+        self, authenticated_client: AsyncClient, test_fii: Fii, deleted_test_fii: Fii
     ):
         """Test soft deleted FIIs are excluded"""
         # Act
-        response = authenticated_client.get("/api/v1/fiis/")
+        response = await authenticated_client.get("/api/v1/fiis/")
 
         # Assert
         assert response.status_code == 200
@@ -202,23 +197,44 @@ class TestListFiis:
         # Deleted FII should NOT be in list
         assert deleted_test_fii.tag not in fii_tags
 
-    def test_list_fiis_unauthenticated(self, client: TestClient):
+    async def test_list_fiis_query_count(
+        self,
+        authenticated_client: AsyncClient,
+        multiple_test_fiis: list[Fii],
+        query_counter: QueryCounter,
+    ):
+        """Test the list costs a fixed number of queries, whatever the page size"""
+        counts = []
+        for limit in (2, 10):
+            # Act
+            with query_counter:
+                response = await authenticated_client.get(f"/api/v1/fiis/?limit={limit}")
+
+            # Assert
+            assert response.status_code == 200
+            assert len(response.json()) == limit
+            counts.append(query_counter.count)
+
+        # auth (user, roles, RLS SET), list
+        assert counts == [4, 4]
+
+    async def test_list_fiis_unauthenticated(self, client: AsyncClient):
         """Test listing FIIs without authentication"""
         # Act
-        response = client.get("/api/v1/fiis/")
+        response = await client.get("/api/v1/fiis/")
 
         # Assert
         assert response.status_code == 403
 
-    def test_list_fiis_empty_result(self, authenticated_client: TestClient):
+    async def test_list_fiis_empty_result(self, authenticated_client: AsyncClient):
         """Test listing FIIs when none exist"""
         # Act
-        response = authenticated_client.get("/api/v1/fiis/")
+        response = await authenticated_client.get("/api/v1/fiis/")
 
         # Assert
         assert response.status_code == 200
         data = response.json()
-        assert isinstance(data, list)
+        assert_valid_list(data, FiiResponse)
 
 
 # ============================================================================
@@ -228,21 +244,19 @@ class TestListFiis:
 class TestGetFii:
     """Tests for GET /api/v1/fiis/{pk}"""
 
-    def test_get_fii_success(
-        self, authenticated_client: TestClient, test_fii: Fii
+    async def test_get_fii_success(
+        self, authenticated_client: AsyncClient, test_fii: Fii
     ):
         """Test retrieving single FII"""
         # Act
-        response = authenticated_client.get(f"/api/v1/fiis/{test_fii.pk}")
+        response = await authenticated_client.get(f"/api/v1/fiis/{test_fii.pk}")
 
         # Assert
         assert response.status_code == 200
         data = response.json()
 
         # Verify response structure
-        assert_response_has_keys(
-            data, ["pk", "tag", "name", "sector"]
-        )
+        FiiResponse.model_validate(data)
 
         # Verify response values
         assert data["pk"] == test_fii.pk
@@ -250,30 +264,30 @@ class TestGetFii:
         assert data["name"] == test_fii.name
         assert data["sector"] == test_fii.sector
 
-    def test_get_fii_not_found(self, authenticated_client: TestClient):
+    async def test_get_fii_not_found(self, authenticated_client: AsyncClient):
         """Test retrieving non-existent FII"""
         # Act
-        response = authenticated_client.get("/api/v1/fiis/99999")
+        response = await authenticated_client.get("/api/v1/fiis/99999")
 
         # Assert
         assert response.status_code == 404
         assert "not found" in response.json()["detail"].lower()
 
-    def test_get_fii_soft_deleted(
-        self, authenticated_client: TestClient, deleted_test_fii: Fii
+    async def test_get_fii_soft_deleted(
+        self, authenticated_client: AsyncClient, deleted_test_fii: Fii
     ):
         """Test retrieving soft deleted FII"""
         # Act
-        response = authenticated_client.get(f"/api/v1/fiis/{deleted_test_fii.pk}")
+        response = await authenticated_client.get(f"/api/v1/fiis/{deleted_test_fii.pk}")
 
         # Assert
         assert response.status_code == 404
         assert "not found" in response.json()["detail"].lower()
 
-    def test_get_fii_unauthenticated(self, client: TestClient, test_fii: Fii):
+    async def test_get_fii_unauthenticated(self, client: AsyncClient):
         """Test retrieving FII without authentication"""
         # Act
-        response = client.get(f"/api/v1/fiis/{test_fii.pk}")
+        response = await client.get("/api/v1/fiis/1")
 
         # Assert
         assert response.status_code == 403
@@ -286,9 +300,9 @@ class TestGetFii:
 class TestUpdateFii:
     """Tests for PATCH /api/v1/fiis/{pk}"""
 
-    def test_update_fii_success(
+    async def test_update_fii_success(
         self,
-        authenticated_client: TestClient,
+        authenticated_client: AsyncClient,
         test_fii: Fii,
         test_user: User,
         db_session: Session,
@@ -301,7 +315,7 @@ class TestUpdateFii:
         }
 
         # Act
-        response = authenticated_client.patch(
+        response = await authenticated_client.patch(
             f"/api/v1/fiis/{test_fii.pk}", json=update_data
         )
 
@@ -314,13 +328,15 @@ class TestUpdateFii:
         assert data["sector"] == update_data["sector"]
 
         # Verify updated in database
-        db_session.refresh(test_fii)
-        assert test_fii.name == update_data["name"]
-        assert test_fii.sector == update_data["sector"]
-        assert test_fii.updated_by_pk == test_user.pk
-
-    def test_update_fii_partial(
-        self, authenticated_client: TestClient, test_fii: Fii, db_session: Session
+        name, sector, updated_by_pk = db_session.execute(
+            select(Fii.name, Fii.sector, Fii.updated_by_pk).where(Fii.pk == test_fii.pk)
+        ).one()
+        assert name == update_data["name"]
+        assert sector == update_data["sector"]
+        assert updated_by_pk == test_user.pk
+
+    async def test_update_fii_partial(
+        self, authenticated_client: AsyncClient, test_fii: Fii, db_session: Session
     ):
         """Test partial update (PATCH semantics)"""
         # Arrange
@@ -331,7 +347,7 @@ class TestUpdateFii:
         }
 
         # Act
-        response = authenticated_client.patch(
+        response = await authenticated_client.patch(
             f"/api/v1/fiis/{test_fii.pk}", json=update_data
         )
 
@@ -346,13 +362,15 @@ class TestUpdateFii:
         assert data["sector"] == original_sector
 
         # Verify in database
-        db_session.refresh(test_fii)
-        assert test_fii.name == update_data["name"]
-        assert test_fii.sector == original_sector
+        name, sector = db_session.execute(
+            select(Fii.name, Fii.sector).where(Fii.pk == test_fii.pk)
+        ).one()
+        assert name == update_data["name"]
+        assert sector == original_sector
 
-    def test_update_fii_duplicate_tag(
+    async def test_update_fii_duplicate_tag(
         self,
-        authenticated_client: TestClient,
+        authenticated_client: AsyncClient,
         test_fii: Fii,
         another_test_fii: Fii,
     ):
@@ -363,7 +381,7 @@ class TestUpdateFii:
         }
 
         # Act
-        response = authenticated_client.patch(
+        response = await authenticated_client.patch(
             f"/api/v1/fiis/{test_fii.pk}", json=update_data
         )
 
@@ -371,7 +389,7 @@ class TestUpdateFii:
         assert response.status_code == 400
         assert "already exists" in response.json()["detail"].lower()
 
-    def test_update_fii_not_found(self, authenticated_client: TestClient):
+    async def test_update_fii_not_found(self, authenticated_client: AsyncClient):
         """Test updating non-existent FII"""
         # Arrange
         update_data = {
@@ -379,12 +397,12 @@ class TestUpdateFii:
         }
 
         # Act
-        response = authenticated_client.patch("/api/v1/fiis/99999", json=update_data)
+        response = await authenticated_client.patch("/api/v1/fiis/99999", json=update_data)
 
         # Assert
         assert response.status_code == 404
 
-    def test_update_fii_unauthenticated(self, client: TestClient, test_fii: Fii):
+    async def test_update_fii_unauthenticated(self, client: AsyncClient):
         """Test updating FII without authentication"""
         # Arrange
         update_data = {
@@ -392,7 +410,7 @@ class TestUpdateFii:
         }
 
         # Act
-        response = client.patch(f"/api/v1/fiis/{test_fii.pk}", json=update_data)
+        response = await client.patch("/api/v1/fiis/1", json=update_data)
 
         # Assert
         assert response.status_code == 403
@@ -405,9 +423,9 @@ class TestUpdateFii:
 class TestDeleteFii:
     """Tests for DELETE /api/v1/fiis/{pk}"""
 
-    def test_delete_fii_success(
+    async def test_delete_fii_success(
         self,
-        authenticated_client: TestClient,
+        authenticated_client: AsyncClient,
         test_fii: Fii,
         test_user: User,
         db_session: Session,
@@ -417,47 +435,42 @@ class TestDeleteFii:
         fii_pk = test_fii.pk
 
         # Act
-        response = authenticated_client.delete(f"/api/v1/fiis/{fii_pk}")
+        response = await authenticated_client.delete(f"/api/v1/fiis/{fii_pk}")
 
         # Assert
         assert response.status_code == 204
         assert response.content == b""
 
-        # Verify soft deleted in database
-        db_session.expire_all()  # Force reload from database
-        fii = db_session.query(Fii).filter(
-            Fii.pk == fii_pk, Fii.rm_timestamp.is_(None)
-        ).first()
-        assert fii is None  # Should not be found (soft deleted)
-
-        # Verify with include_deleted
-        fii_with_deleted = db_session.query(Fii).filter(Fii.pk == fii_pk).first()
-        assert fii_with_deleted is not None
-        assert_soft_deleted(fii_with_deleted)
-        assert fii_with_deleted.updated_by_pk == test_user.pk
+        # Verify soft deleted in database (row still exists, rm_timestamp set)
+        row = db_session.execute(
+            select(Fii.pk, Fii.rm_timestamp, Fii.updated_by_pk).where(Fii.pk == fii_pk)
+        ).one_or_none()
+        assert row is not None
+        assert row.rm_timestamp is not None
+        assert row.updated_by_pk == test_user.pk
 
-    def test_delete_fii_not_found(self, authenticated_client: TestClient):
+    async def test_delete_fii_not_found(self, authenticated_client: AsyncClient):
         """Test deleting non-existent FII"""
         # Act
-        response = authenticated_client.delete("/api/v1/fiis/99999")
+        response = await authenticated_client.delete("/api/v1/fiis/99999")
 
         # Assert
         assert response.status_code == 404
 
-    def test_delete_fii_already_deleted(
-        self, authenticated_client: TestClient, deleted_test_fii: Fii
+    async def test_delete_fii_already_deleted(
+        self, authenticated_client: AsyncClient, deleted_test_fii: Fii
     ):
         """Test deleting already deleted FII"""
         # Act
-        response = authenticated_client.delete(f"/api/v1/fiis/{deleted_test_fii.pk}")
+        response = await authenticated_client.delete(f"/api/v1/fiis/{deleted_test_fii.pk}")
 
         # Assert
         assert response.status_code == 404
 
-    def test_delete_fii_unauthenticated(self, client: TestClient, test_fii: Fii):
+    async def test_delete_fii_unauthenticated(self, client: AsyncClient):
         """Test deleting FII without authentication"""
         # Act
-        response = client.delete(f"/api/v1/fiis/{test_fii.pk}")
+        response = await client.delete("/api/v1/fiis/1")
 
         # Assert
         assert response.status_code == 403
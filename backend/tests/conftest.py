@@ -5,15 +5,19 @@ This module provides pytest fixtures for database sessions, FastAPI test clients
 authentication, and test data creation.
 """
 
+from functools import lru_cache
+
 import pytest
+import pytest_asyncio
 from datetime import date, timedelta
 from decimal import Decimal
-from faker import Faker
-from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
-from sqlalchemy.orm import Session, sessionmaker
+from httpx import ASGITransport, AsyncClient
+from passlib.context import CryptContext
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session
 from sqlalchemy.pool import StaticPool
 
+from app.core import security
 from app.core.security import create_access_token, get_password_hash
 from app.db.base import Base
 from app.db.models.dividend import Dividend
@@ -21,15 +25,70 @@ from app.db.models.fii import Fii
 from app.db.models.fii_transaction import FiiTransaction
 from app.db.models.refresh_token import RefreshToken
 from app.db.models.user import User
-from app.db.repositories.dividend_repository import DividendRepository
-from app.db.repositories.fii_repository import FiiRepository
-from app.db.repositories.fii_transaction_repository import FiiTransactionRepository
-from app.db.repositories.user_repository import UserRepository
+from app.db.session import SessionLocal
 from app.main import app
 from app.api.deps import get_db
+from tests.utils.fakers import (
+    FAKE_COMPANIES,
+    FAKE_NAMES,
+    pick,
+    unique_email,
+    unique_tag,
+    unique_username,
+)
+from tests.utils.test_helpers import QueryCounter, bulk_insert
+
+
+# ============================================================================
+# FIXTURE DATA CONSTANTS
+# ============================================================================
+
+# Reference date for every fixture row, evaluated once per run.
+TODAY = date.today()
+# Dates 0..365 days before TODAY, so fixtures index instead of building timedeltas.
+_DAYS_AGO = tuple(TODAY - timedelta(days=n) for n in range(366))
+
+# Decimal literals used inside fixture loops, parsed once.
+D_0_05 = Decimal("0.05")
+D_0_80 = Decimal("0.80")
+D_0_85 = Decimal("0.85")
+D_95_00 = Decimal("95.00")
+D_100_00 = Decimal("100.00")
+D_9500_00 = Decimal("9500.00")
+
+
+# ============================================================================
+# SECURITY FIXTURES
+# ============================================================================
+
+@pytest.fixture(scope="session", autouse=True)
+def fast_password_hashing():
+    """
+    Hash passwords with minimum-cost bcrypt for the whole test session.
+
+    get_password_hash/verify_password look up pwd_context at call time, so
+    swapping it makes every user fixture and login test cheap while still
+    exercising the real bcrypt code path (and hash format) end to end.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(
+            security,
+            "pwd_context",
+            CryptContext(schemes=["bcrypt"], bcrypt__rounds=4, bcrypt__ident="2b"),
+        )
+        yield
+
+
+@lru_cache(maxsize=8)
+def _hashed_password(password: str) -> str:
+    """
+    Hash a fixture password once and reuse the result.
 
-# Initialize Faker
-fake = Faker("pt_BR")  # Brazilian Portuguese for realistic FII data
+    Each bcrypt hash embeds its own salt, so one cached hash verifies for
+    every user that shares the password. Only called from fixtures, after
+    fast_password_hashing has swapped in the cheap context.
+    """
+    return get_password_hash(password)
 
 
 # ============================================================================
@@ -41,7 +100,14 @@ def test_engine():
     """
     Create test database engine (session-scoped).
 
-    Uses SQLite in-memory database for fast, isolated tests.
+    Uses a private SQLite in-memory database for fast, isolated tests. Every
+    connection to sqlite:///:memory: opens a separate, empty database, so the
+    engine uses StaticPool: seed_session, every db_session and the API under
+    test all share one DBAPI connection. The schema is created once per test
+    session.
+
+    An in-memory database lives only in the process that opened it, so each
+    pytest-xdist worker already has its own.
     """
     engine = create_engine(
         "sqlite:///:memory:",
@@ -49,6 +115,28 @@ def test_engine():
         poolclass=StaticPool,
     )
 
+    # pysqlite's own transaction handling breaks SAVEPOINT support, so let
+    # SQLAlchemy emit BEGIN itself (see SQLAlchemy docs, "Serializable
+    # isolation / Savepoints / Transactional DDL" for the SQLite dialect)
+    @event.listens_for(engine, "connect")
+    def _disable_pysqlite_transactions(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    # Nothing needs to survive a crash: keep the journal in memory, skip
+    # fsync, and enforce foreign keys like PostgreSQL does
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=MEMORY")
+        cursor.execute("PRAGMA synchronous=OFF")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.close()
+
+    @event.listens_for(engine, "begin")
+    def _emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
     # Create all tables
     Base.metadata.create_all(bind=engine)
 
@@ -58,36 +146,101 @@ def test_engine():
     Base.metadata.drop_all(bind=engine)
 
 
+@pytest.fixture(scope="session")
+def seed_session(test_engine):
+    """
+    Create database session for session-scoped seed data.
+
+    Rows committed here exist before any test's outer transaction begins, so
+    the per-test rollback never removes them. It shares the engine's single
+    connection with db_session, so seed fixtures must never run while a test
+    transaction is open; seed_data guarantees that ordering. Instances stay loaded after
+    commit (expire_on_commit=False) so tests can read their attributes
+    without going back to this session.
+    """
+    session = Session(bind=test_engine, autoflush=False, expire_on_commit=False)
+
+    yield session
+
+    session.close()
+
+
+@pytest.fixture(scope="session")
+def seed_data(test_user, another_test_user, test_fii, another_test_fii, other_user_transaction):
+    """
+    Build every session-scoped seed row up front.
+
+    db_session depends on this, so all seeding commits on the shared
+    connection before the first test opens its outer transaction, whatever
+    order fixtures are requested in (including request.getfixturevalue()).
+    """
+
+
 @pytest.fixture(scope="function")
-def db_session(test_engine):
+def db_session(test_engine, seed_data):
     """
-    Create fresh database session for each test (function-scoped).
+    Create database session for each test (function-scoped).
 
-    Each test gets a clean database state with automatic rollback after test.
+    The session is joined into an external transaction: every test runs inside
+    an outer transaction on the engine's shared connection, and each
+    session.commit() only releases a SAVEPOINT. Rolling back the outer transaction at teardown
+    discards everything the test (and the API under test) wrote, without
+    rebuilding the schema.
+
+    expire_on_commit follows the application's SessionLocal (instances stay
+    loaded after commit), so fixtures return them without a refresh()
+    round-trip and the API tests' query counts match production.
     """
-    TestingSessionLocal = sessionmaker(
-        autocommit=False, autoflush=False, bind=test_engine
-    )
+    connection = test_engine.connect()
+    transaction = connection.begin()
 
-    session = TestingSessionLocal()
+    session = Session(
+        bind=connection,
+        autoflush=False,
+        expire_on_commit=SessionLocal.kw["expire_on_commit"],
+        join_transaction_mode="create_savepoint",
+    )
 
     yield session
 
-    # Rollback any uncommitted changes
-    session.rollback()
     session.close()
+    transaction.rollback()
+    connection.close()
+
+
+@pytest.fixture
+def query_counter(test_engine):
+    """
+    Count SQL statements run against the test engine.
+
+    Use as a context manager around the code under test, then assert
+    `query_counter.count ==` the exact number of statements expected.
+    """
+    return QueryCounter(test_engine)
 
 
 # ============================================================================
 # FASTAPI CLIENT FIXTURES
 # ============================================================================
 
+@pytest.fixture(scope="session")
+def asgi_transport():
+    """
+    ASGI transport into the FastAPI app (session-scoped).
+
+    The transport holds no per-test state, so one instance serves every
+    client. Lifespan events are never run through it.
+    """
+    return ASGITransport(app=app)
+
+
 @pytest.fixture
-def client(db_session: Session):
+def override_db(db_session: Session):
     """
-    FastAPI TestClient with database override (unauthenticated).
+    Route the app's get_db dependency to the test database session.
 
-    Returns a test client that uses the test database session.
+    Only the get_db override is removed on teardown, so overrides installed by
+    other fixtures or tests are left alone.
     """
     def override_get_db():
         try:
@@ -97,47 +250,75 @@ def client(db_session: Session):
 
     app.dependency_overrides[get_db] = override_get_db
 
-    with TestClient(app) as test_client:
+    yield
+
+    app.dependency_overrides.pop(get_db, None)
+
+
+@pytest_asyncio.fixture
+async def client(override_db, asgi_transport: ASGITransport):
+    """
+    Async HTTP client with database override (unauthenticated).
+
+    Returns an httpx.AsyncClient that drives the ASGI app directly on the test
+    event loop (no TestClient portal thread) and uses the test database session.
+    """
+    async with AsyncClient(transport=asgi_transport, base_url="http://test") as test_client:
         yield test_client
 
-    app.dependency_overrides.clear()
+
+@pytest.fixture(scope="session")
+def auth_headers(test_user_token: str) -> dict[str, str]:
+    """
+    Authorization header for the test user (session-scoped).
+    """
+    return {"Authorization": f"Bearer {test_user_token}"}
 
 
-@pytest.fixture
-def authenticated_client(client: TestClient, test_user_token: str):
+@pytest_asyncio.fixture
+async def authenticated_client(
+    override_db, asgi_transport: ASGITransport, auth_headers: dict[str, str]
+):
     """
-    FastAPI TestClient with authentication header.
+    Async HTTP client with authentication header.
 
-    Returns a test client with JWT token set in Authorization header.
+    Returns its own client with the JWT token set in the Authorization header,
+    so a test can use it alongside the unauthenticated `client` fixture.
     """
-    client.headers.update({"Authorization": f"Bearer {test_user_token}"})
-    return client
+    async with AsyncClient(
+        transport=asgi_transport, base_url="http://test", headers=auth_headers
+    ) as test_client:
+        yield test_client
 
 
 # ============================================================================
 # USER FIXTURES
 # ============================================================================
 
-@pytest.fixture
-def test_user(db_session: Session):
+@pytest.fixture(scope="session")
+def test_user(seed_session: Session):
     """
-    Create test user with default credentials.
+    Create test user with default credentials (session-scoped).
+
+    Inserted once per run through seed_session, so it survives the per-test
+    rollback. Tests must not modify it.
 
     Returns:
         User: Test user with pk, email, username, is_active=True
     """
     user = User(
-        email=fake.email(),
-        username=fake.user_name(),
-        hashed_password=get_password_hash("testpassword123"),
-        full_name=fake.name(),
+        email=unique_email(),
+        username=unique_username(),
+        hashed_password=_hashed_password("testpassword123"),
+        full_name=pick(FAKE_NAMES),
         is_active=True,
         is_superuser=False,
     )
 
-    db_session.add(user)
-    db_session.commit()
-    db_session.refresh(user)
+    seed_session.add(user)
+    seed_session.flush()
+    seed_session.refresh(user)
+    seed_session.commit()
 
     # Store plain password for login tests
     user.plain_password = "testpassword123"  # type: ignore
@@ -145,10 +326,13 @@ def test_user(db_session: Session):
     return user
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def test_user_token(test_user: User) -> str:
     """
-    Generate JWT access token for test user.
+    Generate JWT access token for test user (session-scoped).
+
+    test_user's pk is stable for the whole run, so the token is
+    signed once and reused.
 
     Returns:
         str: JWT access token
@@ -165,43 +349,43 @@ def inactive_test_user(db_session: Session):
         User: Inactive user with is_active=False
     """
     user = User(
-        email=fake.email(),
-        username=fake.user_name(),
-        hashed_password=get_password_hash("testpassword123"),
-        full_name=fake.name(),
+        email=unique_email(),
+        username=unique_username(),
+        hashed_password=_hashed_password("testpassword123"),
+        full_name=pick(FAKE_NAMES),
         is_active=False,
         is_superuser=False,
     )
 
     db_session.add(user)
     db_session.commit()
-    db_session.refresh(user)
 
     user.plain_password = "testpassword123"  # type: ignore
 
     return user
 
 
-@pytest.fixture
-def another_test_user(db_session: Session):
+@pytest.fixture(scope="session")
+def another_test_user(seed_session: Session):
     """
-    Create second test user for ownership tests.
+    Create second test user for ownership tests (session-scoped, read-only).
 
     Returns:
         User: Another test user
     """
     user = User(
-        email=fake.email(),
-        username=fake.user_name(),
-        hashed_password=get_password_hash("anotherpassword123"),
-        full_name=fake.name(),
+        email=unique_email(),
+        username=unique_username(),
+        hashed_password=_hashed_password("anotherpassword123"),
+        full_name=pick(FAKE_NAMES),
         is_active=True,
         is_superuser=False,
     )
 
-    db_session.add(user)
-    db_session.commit()
-    db_session.refresh(user)
+    seed_session.add(user)
+    seed_session.flush()
+    seed_session.refresh(user)
+    seed_session.commit()
 
     user.plain_password = "anotherpassword123"  # type: ignore
 
@@ -212,48 +396,58 @@ def another_test_user(db_session: Session):
 # FII FIXTURES
 # ============================================================================
 
-@pytest.fixture
-def test_fii(db_session: Session, test_user: User):
+@pytest.fixture(scope="session")
+def test_fii(seed_session: Session, test_user: User):
     """
-    Create test FII.
+    Create test FII (session-scoped, read-only).
+
+    The instance is expunged after commit, so it is a detached snapshot
+    that no session's identity map holds between tests.
 
     Returns:
         Fii: Test FII with realistic Brazilian data
     """
     fii = Fii(
-        tag=fake.lexify(text="????11").upper(),  # e.g., "XPLG11"
-        name=fake.company() + " FII",
+        tag=unique_tag(),
+        name=pick(FAKE_COMPANIES) + " FII",
         sector="Logística",
         created_by_pk=test_user.pk,
         updated_by_pk=test_user.pk,
     )
 
-    db_session.add(fii)
-    db_session.commit()
-    db_session.refresh(fii)
+    seed_session.add(fii)
+    seed_session.flush()
+    seed_session.refresh(fii)
+    seed_session.commit()
+    seed_session.expunge(fii)
 
     return fii
 
 
-@pytest.fixture
-def another_test_fii(db_session: Session, test_user: User):
+@pytest.fixture(scope="session")
+def another_test_fii(seed_session: Session, test_user: User):
     """
-    Create second test FII for multi-FII tests.
+    Create second test FII for multi-FII tests (session-scoped, read-only).
+
+    The instance is expunged after commit, so it is a detached snapshot
+    that no session's identity map holds between tests.
 
     Returns:
         Fii: Another test FII
     """
     fii = Fii(
-        tag=fake.lexify(text="????11").upper(),
-        name=fake.company() + " FII",
+        tag=unique_tag(),
+        name=pick(FAKE_COMPANIES) + " FII",
         sector="Shopping",
         created_by_pk=test_user.pk,
         updated_by_pk=test_user.pk,
     )
 
-    db_session.add(fii)
-    db_session.commit()
-    db_session.refresh(fii)
+    seed_session.add(fii)
+    seed_session.flush()
+    seed_session.refresh(fii)
+    seed_session.commit()
+    seed_session.expunge(fii)
 
     return fii
 
@@ -269,8 +463,8 @@ def deleted_test_fii(db_session: Session, test_user: User):
     import time
 
     fii = Fii(
-        tag=fake.lexify(text="????11").upper(),
-        name=fake.company() + " FII (DELETED)",
+        tag=unique_tag(),
+        name=pick(FAKE_COMPANIES) + " FII (DELETED)",
         sector="Lajes Corporativas",
         created_by_pk=test_user.pk,
         updated_by_pk=test_user.pk,
@@ -279,7 +473,6 @@ def deleted_test_fii(db_session: Session, test_user: User):
 
     db_session.add(fii)
     db_session.commit()
-    db_session.refresh(fii)
 
     return fii
 
@@ -289,27 +482,25 @@ def multiple_test_fiis(db_session: Session, test_user: User):
     """
     Create multiple test FIIs for pagination tests.
 
+    Rows are inserted with bulk_insert().
+
     Returns:
         list[Fii]: List of 10 test FIIs
     """
-    fiis = []
     sectors = ["Logística", "Shopping", "Lajes Corporativas", "Títulos e Val. Mob.", "Híbrido"]
 
-    for i in range(10):
-        fii = Fii(
-            tag=fake.lexify(text="????11").upper(),
-            name=f"{fake.company()} FII {i+1}",
-            sector=sectors[i % len(sectors)],
-            created_by_pk=test_user.pk,
-            updated_by_pk=test_user.pk,
-        )
-        fiis.append(fii)
-
-    db_session.add_all(fiis)
-    db_session.commit()
+    rows = [
+        {
+            "tag": unique_tag(),
+            "name": f"{pick(FAKE_COMPANIES)} FII {i+1}",
+            "sector": sectors[i % len(sectors)],
+            "created_by_pk": test_user.pk,
+            "updated_by_pk": test_user.pk,
+        }
+        for i in range(10)
+    ]
 
-    for fii in fiis:
-        db_session.refresh(fii)
+    fiis = bulk_insert(db_session, Fii, rows)
 
     return fiis
 
@@ -319,53 +510,36 @@ def fiis_multiple_sectors(db_session: Session, test_user: User):
     """
     Create FIIs across multiple sectors for filtering tests.
 
+    Rows are inserted with bulk_insert().
+
     Returns:
         dict: {"logistica": [Fii], "shopping": [Fii], "lajes": [Fii]}
     """
-    fiis = {
-        "logistica": [],
-        "shopping": [],
-        "lajes": [],
+    sectors = {
+        "logistica": ("Logística", "Logística"),
+        "shopping": ("Shopping", "Shopping"),
+        "lajes": ("Lajes Corporativas", "Lajes"),
     }
 
     # Create 2 FIIs per sector
-    for _ in range(2):
-        fii_logistica = Fii(
-            tag=fake.lexify(text="????11").upper(),
-            name=fake.company() + " Logística FII",
-            sector="Logística",
-            created_by_pk=test_user.pk,
-            updated_by_pk=test_user.pk,
-        )
-        fiis["logistica"].append(fii_logistica)
-
-        fii_shopping = Fii(
-            tag=fake.lexify(text="????11").upper(),
-            name=fake.company() + " Shopping FII",
-            sector="Shopping",
-            created_by_pk=test_user.pk,
-            updated_by_pk=test_user.pk,
-        )
-        fiis["shopping"].append(fii_shopping)
-
-        fii_lajes = Fii(
-            tag=fake.lexify(text="????11").upper(),
-            name=fake.company() + " Lajes FII",
-            sector="Lajes Corporativas",
-            created_by_pk=test_user.pk,
-            updated_by_pk=test_user.pk,
-        )
-        fiis["lajes"].append(fii_lajes)
-
-    all_fiis = fiis["logistica"] + fiis["shopping"] + fiis["lajes"]
-    db_session.add_all(all_fiis)
-    db_session.commit()
-
-    for fii_list in fiis.values():
-        for fii in fii_list:
-            db_session.refresh(fii)
-
-    return fiis
+    rows = [
+        {
+            "tag": unique_tag(),
+            "name": f"{pick(FAKE_COMPANIES)} {label} FII",
+            "sector": sector,
+            "created_by_pk": test_user.pk,
+            "updated_by_pk": test_user.pk,
+        }
+        for sector, label in sectors.values()
+        for _ in range(2)
+    ]
+
+    created = bulk_insert(db_session, Fii, rows)
+
+    return {
+        key: [fii for fii in created if fii.sector == sector]
+        for key, (sector, _) in sectors.items()
+    }
 
 
 # ============================================================================
@@ -384,7 +558,7 @@ def test_transaction(db_session: Session, test_user: User, test_fii: Fii):
         user_pk=test_user.pk,
         fii_pk=test_fii.pk,
         transaction_type="buy",
-        transaction_date=date.today() - timedelta(days=30),
+        transaction_date=_DAYS_AGO[30],
         quantity=100,
         price_per_unit=Decimal("95.50"),
         total_amount=Decimal("9550.00"),
@@ -394,15 +568,17 @@ def test_transaction(db_session: Session, test_user: User, test_fii: Fii):
 
     db_session.add(transaction)
     db_session.commit()
-    db_session.refresh(transaction)
 
     return transaction
 
 
-@pytest.fixture
-def other_user_transaction(db_session: Session, another_test_user: User, test_fii: Fii):
+@pytest.fixture(scope="session")
+def other_user_transaction(seed_session: Session, another_test_user: User, test_fii: Fii):
     """
-    Create transaction owned by another user for ownership tests.
+    Create transaction owned by another user for ownership tests (session-scoped, read-only).
+
+    Every endpoint rejects test_user's access to it before writing, so one
+    seeded row serves all ownership tests.
 
     Returns:
         FiiTransaction: Transaction owned by another_test_user
@@ -411,17 +587,19 @@ def other_user_transaction(db_session: Session, another_test_user: User, test_fi
         user_pk=another_test_user.pk,
         fii_pk=test_fii.pk,
         transaction_type="buy",
-        transaction_date=date.today() - timedelta(days=15),
+        transaction_date=_DAYS_AGO[15],
         quantity=50,
-        price_per_unit=Decimal("100.00"),
+        price_per_unit=D_100_00,
         total_amount=Decimal("5000.00"),
         created_by_pk=another_test_user.pk,
         updated_by_pk=another_test_user.pk,
     )
 
-    db_session.add(transaction)
-    db_session.commit()
-    db_session.refresh(transaction)
+    seed_session.add(transaction)
+    seed_session.flush()
+    seed_session.refresh(transaction)
+    seed_session.commit()
+    seed_session.expunge(transaction)
 
     return transaction
 
@@ -431,50 +609,49 @@ def buy_and_sell_transactions(db_session: Session, test_user: User, test_fii: Fi
     """
     Create both buy and sell transactions for type filtering tests.
 
+    Rows are inserted with bulk_insert().
+
     Returns:
         dict: {"buy": [FiiTransaction], "sell": [FiiTransaction]}
     """
-    transactions = {"buy": [], "sell": []}
-
     # Create 2 buy transactions
-    for i in range(2):
-        buy_transaction = FiiTransaction(
-            user_pk=test_user.pk,
-            fii_pk=test_fii.pk,
-            transaction_type="buy",
-            transaction_date=date.today() - timedelta(days=60 - i*10),
-            quantity=100 + i*50,
-            price_per_unit=Decimal("95.00") + Decimal(i),
-            total_amount=Decimal((100 + i*50) * (95.00 + i)),
-            created_by_pk=test_user.pk,
-            updated_by_pk=test_user.pk,
-        )
-        transactions["buy"].append(buy_transaction)
+    rows = [
+        {
+            "user_pk": test_user.pk,
+            "fii_pk": test_fii.pk,
+            "transaction_type": "buy",
+            "transaction_date": _DAYS_AGO[60 - i*10],
+            "quantity": 100 + i*50,
+            "price_per_unit": D_95_00 + i,
+            "total_amount": Decimal(100 + i*50) * (D_95_00 + i),
+            "created_by_pk": test_user.pk,
+            "updated_by_pk": test_user.pk,
+        }
+        for i in range(2)
+    ]
 
     # Create 2 sell transactions
-    for i in range(2):
-        sell_transaction = FiiTransaction(
-            user_pk=test_user.pk,
-            fii_pk=test_fii.pk,
-            transaction_type="sell",
-            transaction_date=date.today() - timedelta(days=20 - i*5),
-            quantity=50 + i*20,
-            price_per_unit=Decimal("100.00") + Decimal(i*2),
-            total_amount=Decimal((50 + i*20) * (100.00 + i*2)),
-            created_by_pk=test_user.pk,
-            updated_by_pk=test_user.pk,
-        )
-        transactions["sell"].append(sell_transaction)
-
-    all_transactions = transactions["buy"] + transactions["sell"]
-    db_session.add_all(all_transactions)
-    db_session.commit()
-
-    for trans_list in transactions.values():
-        for trans in trans_list:
-            db_session.refresh(trans)
-
-    return transactions
+    rows += [
+        {
+            "user_pk": test_user.pk,
+            "fii_pk": test_fii.pk,
+            "transaction_type": "sell",
+            "transaction_date": _DAYS_AGO[20 - i*5],
+            "quantity": 50 + i*20,
+            "price_per_unit": D_100_00 + i*2,
+            "total_amount": Decimal(50 + i*20) * (D_100_00 + i*2),
+            "created_by_pk": test_user.pk,
+            "updated_by_pk": test_user.pk,
+        }
+        for i in range(2)
+    ]
+
+    created = bulk_insert(db_session, FiiTransaction, rows)
+
+    return {
+        transaction_type: [t for t in created if t.transaction_type == transaction_type]
+        for transaction_type in ("buy", "sell")
+    }
 
 
 @pytest.fixture
@@ -482,36 +659,34 @@ def transactions_multiple_fiis(db_session: Session, test_user: User, test_fii: F
     """
     Create transactions for multiple FIIs for filtering tests.
 
+    Rows are inserted with bulk_insert().
+
     Returns:
         dict: {test_fii.pk: [FiiTransaction], another_test_fii.pk: [FiiTransaction]}
     """
-    transactions = {test_fii.pk: [], another_test_fii.pk: []}
-
     # Create 2 transactions for each FII
-    for fii in [test_fii, another_test_fii]:
-        for i in range(2):
-            transaction = FiiTransaction(
-                user_pk=test_user.pk,
-                fii_pk=fii.pk,
-                transaction_type="buy",
-                transaction_date=date.today() - timedelta(days=30 - i*10),
-                quantity=100,
-                price_per_unit=Decimal("95.00"),
-                total_amount=Decimal("9500.00"),
-                created_by_pk=test_user.pk,
-                updated_by_pk=test_user.pk,
-            )
-            transactions[fii.pk].append(transaction)
-
-    all_transactions = transactions[test_fii.pk] + transactions[another_test_fii.pk]
-    db_session.add_all(all_transactions)
-    db_session.commit()
-
-    for trans_list in transactions.values():
-        for trans in trans_list:
-            db_session.refresh(trans)
-
-    return transactions
+    rows = [
+        {
+            "user_pk": test_user.pk,
+            "fii_pk": fii.pk,
+            "transaction_type": "buy",
+            "transaction_date": _DAYS_AGO[30 - i*10],
+            "quantity": 100,
+            "price_per_unit": D_95_00,
+            "total_amount": D_9500_00,
+            "created_by_pk": test_user.pk,
+            "updated_by_pk": test_user.pk,
+        }
+        for fii in [test_fii, another_test_fii]
+        for i in range(2)
+    ]
+
+    created = bulk_insert(db_session, FiiTransaction, rows)
+
+    return {
+        fii.pk: [t for t in created if t.fii_pk == fii.pk]
+        for fii in [test_fii, another_test_fii]
+    }
 
 
 @pytest.fixture
@@ -519,31 +694,28 @@ def transactions_various_dates(db_session: Session, test_user: User, test_fii: F
     """
     Create transactions across various dates for date range filtering.
 
+    Rows are inserted with bulk_insert().
+
     Returns:
         list[FiiTransaction]: Transactions from 90 days ago to today
     """
-    transactions = []
-
     # Create transactions at 10-day intervals over 90 days
-    for i in range(10):
-        transaction = FiiTransaction(
-            user_pk=test_user.pk,
-            fii_pk=test_fii.pk,
-            transaction_type="buy",
-            transaction_date=date.today() - timedelta(days=90 - i*10),
-            quantity=100,
-            price_per_unit=Decimal("95.00") + Decimal(i),
-            total_amount=Decimal(100 * (95.00 + i)),
-            created_by_pk=test_user.pk,
-            updated_by_pk=test_user.pk,
-        )
-        transactions.append(transaction)
-
-    db_session.add_all(transactions)
-    db_session.commit()
-
-    for trans in transactions:
-        db_session.refresh(trans)
+    rows = [
+        {
+            "user_pk": test_user.pk,
+            "fii_pk": test_fii.pk,
+            "transaction_type": "buy",
+            "transaction_date": _DAYS_AGO[90 - i*10],
+            "quantity": 100,
+            "price_per_unit": D_95_00 + i,
+            "total_amount": 100 * (D_95_00 + i),
+            "created_by_pk": test_user.pk,
+            "updated_by_pk": test_user.pk,
+        }
+        for i in range(10)
+    ]
+
+    transactions = bulk_insert(db_session, FiiTransaction, rows)
 
     return transactions
 
@@ -553,30 +725,27 @@ def many_transactions(db_session: Session, test_user: User, test_fii: Fii):
     """
     Create many transactions for pagination tests.
 
+    Rows are inserted with bulk_insert().
+
     Returns:
         list[FiiTransaction]: 15 transactions
     """
-    transactions = []
-
-    for i in range(15):
-        transaction = FiiTransaction(
-            user_pk=test_user.pk,
-            fii_pk=test_fii.pk,
-            transaction_type="buy" if i % 2 == 0 else "sell",
-            transaction_date=date.today() - timedelta(days=100 - i*5),
-            quantity=100,
-            price_per_unit=Decimal("95.00") + Decimal(i),
-            total_amount=Decimal(100 * (95.00 + i)),
-            created_by_pk=test_user.pk,
-            updated_by_pk=test_user.pk,
-        )
-        transactions.append(transaction)
-
-    db_session.add_all(transactions)
-    db_session.commit()
-
-    for trans in transactions:
-        db_session.refresh(trans)
+    rows = [
+        {
+            "user_pk": test_user.pk,
+            "fii_pk": test_fii.pk,
+            "transaction_type": "buy" if i % 2 == 0 else "sell",
+            "transaction_date": _DAYS_AGO[100 - i*5],
+            "quantity": 100,
+            "price_per_unit": D_95_00 + i,
+            "total_amount": 100 * (D_95_00 + i),
+            "created_by_pk": test_user.pk,
+            "updated_by_pk": test_user.pk,
+        }
+        for i in range(15)
+    ]
+
+    transactions = bulk_insert(db_session, FiiTransaction, rows)
 
     return transactions
 
@@ -596,15 +765,14 @@ def test_dividend(db_session: Session, test_user: User, test_fii: Fii):
     dividend = Dividend(
         user_pk=test_user.pk,
         fii_pk=test_fii.pk,
-        payment_date=date.today() - timedelta(days=15),
-        amount_per_unit=Decimal("0.85"),
+        payment_date=_DAYS_AGO[15],
+        amount_per_unit=D_0_85,
         created_by_pk=test_user.pk,
         updated_by_pk=test_user.pk,
     )
 
     db_session.add(dividend)
     db_session.commit()
-    db_session.refresh(dividend)
 
     return dividend
 
@@ -620,7 +788,7 @@ def other_user_dividend(db_session: Session, another_test_user: User, test_fii:
     dividend = Dividend(
         user_pk=another_test_user.pk,
         fii_pk=test_fii.pk,
-        payment_date=date.today() - timedelta(days=10),
+        payment_date=_DAYS_AGO[10],
         amount_per_unit=Decimal("0.90"),
         created_by_pk=another_test_user.pk,
         updated_by_pk=another_test_user.pk,
@@ -628,7 +796,6 @@ def other_user_dividend(db_session: Session, another_test_user: User, test_fii:
 
     db_session.add(dividend)
     db_session.commit()
-    db_session.refresh(dividend)
 
     return dividend
 
@@ -638,33 +805,31 @@ def dividends_multiple_fiis(db_session: Session, test_user: User, test_fii: Fii,
     """
     Create dividends for multiple FIIs for filtering tests.
 
+    Rows are inserted with bulk_insert().
+
     Returns:
         dict: {test_fii.pk: [Dividend], another_test_fii.pk: [Dividend]}
     """
-    dividends = {test_fii.pk: [], another_test_fii.pk: []}
-
     # Create 2 dividends for each FII
-    for fii in [test_fii, another_test_fii]:
-        for i in range(2):
-            dividend = Dividend(
-                user_pk=test_user.pk,
-                fii_pk=fii.pk,
-                payment_date=date.today() - timedelta(days=15 + i*30),
-                amount_per_unit=Decimal("0.85") + Decimal(i) * Decimal("0.05"),
-                created_by_pk=test_user.pk,
-                updated_by_pk=test_user.pk,
-            )
-            dividends[fii.pk].append(dividend)
-
-    all_dividends = dividends[test_fii.pk] + dividends[another_test_fii.pk]
-    db_session.add_all(all_dividends)
-    db_session.commit()
-
-    for div_list in dividends.values():
-        for div in div_list:
-            db_session.refresh(div)
-
-    return dividends
+    rows = [
+        {
+            "user_pk": test_user.pk,
+            "fii_pk": fii.pk,
+            "payment_date": _DAYS_AGO[15 + i*30],
+            "amount_per_unit": D_0_85 + D_0_05 * i,
+            "created_by_pk": test_user.pk,
+            "updated_by_pk": test_user.pk,
+        }
+        for fii in [test_fii, another_test_fii]
+        for i in range(2)
+    ]
+
+    created = bulk_insert(db_session, Dividend, rows)
+
+    return {
+        fii.pk: [d for d in created if d.fii_pk == fii.pk]
+        for fii in [test_fii, another_test_fii]
+    }
 
 
 @pytest.fixture
@@ -672,28 +837,25 @@ def dividends_various_dates(db_session: Session, test_user: User, test_fii: Fii)
     """
     Create dividends across various dates for date range filtering.
 
+    Rows are inserted with bulk_insert().
+
     Returns:
         list[Dividend]: Dividends from 120 days ago to today
     """
-    dividends = []
-
     # Create monthly dividends over 4 months
-    for i in range(4):
-        dividend = Dividend(
-            user_pk=test_user.pk,
-            fii_pk=test_fii.pk,
-            payment_date=date.today() - timedelta(days=15 + i*30),
-            amount_per_unit=Decimal("0.80") + Decimal(i) * Decimal("0.05"),
-            created_by_pk=test_user.pk,
-            updated_by_pk=test_user.pk,
-        )
-        dividends.append(dividend)
-
-    db_session.add_all(dividends)
-    db_session.commit()
-
-    for div in dividends:
-        db_session.refresh(div)
+    rows = [
+        {
+            "user_pk": test_user.pk,
+            "fii_pk": test_fii.pk,
+            "payment_date": _DAYS_AGO[15 + i*30],
+            "amount_per_unit": D_0_80 + D_0_05 * i,
+            "created_by_pk": test_user.pk,
+            "updated_by_pk": test_user.pk,
+        }
+        for i in range(4)
+    ]
+
+    dividends = bulk_insert(db_session, Dividend, rows)
 
     return dividends
 
@@ -703,27 +865,24 @@ def many_dividends(db_session: Session, test_user: User, test_fii: Fii):
     """
     Create many dividends for pagination tests.
 
+    Rows are inserted with bulk_insert().
+
     Returns:
         list[Dividend]: 12 monthly dividends
     """
-    dividends = []
-
-    for i in range(12):
-        dividend = Dividend(
-            user_pk=test_user.pk,
-            fii_pk=test_fii.pk,
-            payment_date=date.today() - timedelta(days=15 + i*30),
-            amount_per_unit=Decimal("0.80") + Decimal(i % 4) * Decimal("0.05"),
-            created_by_pk=test_user.pk,
-            updated_by_pk=test_user.pk,
-        )
-        dividends.append(dividend)
-
-    db_session.add_all(dividends)
-    db_session.commit()
+    rows = [
+        {
+            "user_pk": test_user.pk,
+            "fii_pk": test_fii.pk,
+            "payment_date": _DAYS_AGO[15 + i*30],
+            "amount_per_unit": D_0_80 + D_0_05 * (i % 4),
+            "created_by_pk": test_user.pk,
+            "updated_by_pk": test_user.pk,
+        }
+        for i in range(12)
+    ]
 
-    for div in dividends:
-        db_session.refresh(div)
+    dividends = bulk_insert(db_session, Dividend, rows)
 
     return dividends
 
@@ -755,7 +914,6 @@ def test_user_refresh_token(db_session: Session, test_user: User):
 
     db_session.add(refresh_token)
     db_session.commit()
-    db_session.refresh(refresh_token)
 
     # Store token string for use in tests
     refresh_token.token_str = token_str  # type: ignore
@@ -0,0 +1,315 @@
+"""
+Tests for the test data helpers in tests.utils.test_helpers.
+
+Tests for:
+- bulk_insert - Multi-row INSERT ... RETURNING
+- bulk_fixture_session - Deferred single commit for grouped helper calls
+- bulk_create_test_* / create_test_* - Model-specific data helpers
+"""
+
+from datetime import date, timedelta
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import func, inspect, select
+from sqlalchemy.orm import Session
+
+from app.db.models.dividend import Dividend
+from app.db.models.fii import Fii
+from app.db.models.fii_transaction import FiiTransaction
+from app.db.models.user import User
+from tests.utils import test_helpers
+from tests.utils.test_helpers import (
+    QueryCounter,
+    assert_audit_fields,
+    bulk_create_test_dividends,
+    bulk_create_test_fiis,
+    bulk_create_test_transactions,
+    bulk_fixture_session,
+    bulk_insert,
+    create_test_dividend,
+    create_test_fii,
+    create_test_transaction,
+    create_test_user,
+)
+
+# ============================================================================
+# BULK INSERT TESTS
+# ============================================================================
+
+class TestBulkInsert:
+    """Tests for bulk_insert"""
+
+    def test_bulk_insert_returns_created_rows(self, db_session: Session, test_user: User):
+        """Test every input row comes back as a loaded instance"""
+        # Arrange
+        rows = [
+            {"tag": f"ORDR{i:02d}", "name": f"Order FII {i}", "created_by_pk": test_user.pk}
+            for i in range(20)
+        ]
+
+        # Act
+        created = bulk_insert(db_session, Fii, rows)
+
+        # Assert
+        assert sorted(fii.tag for fii in created) == [row["tag"] for row in rows]
+        assert all(fii.pk is not None and fii.created_at is not None for fii in created)
+
+    def test_bulk_insert_batches(
+        self, db_session: Session, test_user: User, query_counter: QueryCounter
+    ):
+        """Test rows are split into batch_size INSERTs and all are returned"""
+        # Arrange
+        rows = [{"tag": f"BTCH{i:02d}", "name": f"Batch FII {i}"} for i in range(10)]
+
+        # Act
+        with query_counter:
+            created = bulk_insert(db_session, Fii, rows, batch_size=3)
+
+        # Assert
+        assert query_counter.count == 4  # 3 + 3 + 3 + 1
+        assert sorted(fii.tag for fii in created) == [row["tag"] for row in rows]
+        pks = [fii.pk for fii in created]
+        assert db_session.scalar(select(func.count()).where(Fii.pk.in_(pks))) == 10
+
+    def test_bulk_insert_default_batch_size(
+        self,
+        db_session: Session,
+        query_counter: QueryCounter,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        """Test bulk_insert falls back to BULK_BATCH_SIZE"""
+        # Arrange
+        monkeypatch.setattr(test_helpers, "BULK_BATCH_SIZE", 4)
+        rows = [{"tag": f"DFLT{i:02d}", "name": f"Default FII {i}"} for i in range(10)]
+
+        # Act
+        with query_counter:
+            created = bulk_insert(db_session, Fii, rows)
+
+        # Assert
+        assert query_counter.count == 3  # 4 + 4 + 2
+        assert len(created) == 10
+
+    @pytest.mark.parametrize("env_value, expected", [(None, 50), ("7", 7)])
+    def test_batch_size_from_env(
+        self, monkeypatch: pytest.MonkeyPatch, env_value: str | None, expected: int
+    ):
+        """Test TEST_BULK_BATCH_SIZE overrides the default batch size"""
+        # Arrange
+        if env_value is None:
+            monkeypatch.delenv("TEST_BULK_BATCH_SIZE", raising=False)
+        else:
+            monkeypatch.setenv("TEST_BULK_BATCH_SIZE", env_value)
+
+        # Act / Assert
+        assert test_helpers._batch_size_from_env() == expected
+
+
+# ============================================================================
+# BULK FIXTURE SESSION TESTS
+# ============================================================================
+
+@pytest.fixture
+def commit_calls(db_session: Session, monkeypatch: pytest.MonkeyPatch) -> list[None]:
+    """Record every db_session.commit() call while still committing"""
+    calls: list[None] = []
+    commit = db_session.commit
+
+    def counting_commit() -> None:
+        calls.append(None)
+        commit()
+
+    monkeypatch.setattr(db_session, "commit", counting_commit)
+    return calls
+
+
+class TestBulkFixtureSession:
+    """Tests for bulk_fixture_session"""
+
+    def test_commits_once_on_success(
+        self, db_session: Session, test_user: User, commit_calls: list[None]
+    ):
+        """Test helpers inside the block only flush and the block commits once"""
+        # Act
+        with bulk_fixture_session(db_session):
+            fiis = [create_test_fii(db_session, test_user.pk) for _ in range(3)]
+            create_test_transaction(db_session, test_user.pk, fiis[0].pk)
+            inside_calls = len(commit_calls)
+
+        # Assert
+        assert inside_calls == 0
+        assert len(commit_calls) == 1
+        pks = [fii.pk for fii in fiis]
+        assert db_session.scalar(select(func.count()).where(Fii.pk.in_(pks))) == 3
+
+    def test_rolls_back_on_exception(
+        self, db_session: Session, test_user: User, commit_calls: list[None]
+    ):
+        """Test an exception discards every row created inside the block"""
+        # Arrange
+        fii_count = db_session.scalar(select(func.count()).select_from(Fii))
+
+        # Act
+        with pytest.raises(RuntimeError):
+            with bulk_fixture_session(db_session):
+                create_test_fii(db_session, test_user.pk, tag="ROLL11")
+                raise RuntimeError("boom")
+
+        # Assert
+        assert commit_calls == []
+        assert db_session.scalar(select(func.count()).select_from(Fii)) == fii_count
+        assert db_session.scalar(select(Fii).where(Fii.tag == "ROLL11")) is None
+        # Helpers commit again once the block is closed
+        create_test_fii(db_session, test_user.pk)
+        assert len(commit_calls) == 1
+
+    def test_nested_block_defers_to_outermost(
+        self, db_session: Session, test_user: User, commit_calls: list[None]
+    ):
+        """Test an inner block neither commits nor ends the outer deferral"""
+        # Act
+        with bulk_fixture_session(db_session):
+            with bulk_fixture_session(db_session):
+                create_test_fii(db_session, test_user.pk)
+            after_inner = len(commit_calls)
+            create_test_fii(db_session, test_user.pk)
+            after_helper = len(commit_calls)
+
+        # Assert
+        assert (after_inner, after_helper) == (0, 0)
+        assert len(commit_calls) == 1
+
+
+# ============================================================================
+# MODEL HELPER TESTS
+# ============================================================================
+
+class TestUserHelpers:
+    """Tests for create_test_user"""
+
+    def test_create_test_user(self, db_session: Session, query_counter: QueryCounter):
+        """Test a single INSERT returns the user with pk and server defaults loaded"""
+        # Act
+        with query_counter:
+            user = create_test_user(db_session, full_name="Helper User")
+
+        # Assert
+        assert query_counter.count == 1
+        assert user.pk is not None
+        assert user.plain_password == "testpassword123"
+        state = inspect(user)
+        assert {"created_at", "updated_at"}.isdisjoint(state.unloaded)
+        assert user.created_at is not None and user.full_name == "Helper User"
+
+
+class TestFiiHelpers:
+    """Tests for bulk_create_test_fiis / create_test_fii"""
+
+    def test_bulk_create_test_fiis(self, db_session: Session, test_user: User):
+        """Test FIIs are persisted with unique tags, overrides and audit fields"""
+        # Act
+        fiis = bulk_create_test_fiis(db_session, test_user.pk, 12, {"sector": "Shopping"})
+
+        # Assert
+        pks = [fii.pk for fii in fiis]
+        assert db_session.scalar(select(func.count()).where(Fii.pk.in_(pks))) == 12
+        assert len({fii.tag for fii in fiis}) == 12
+        assert all(fii.sector == "Shopping" and fii.name.endswith(" FII") for fii in fiis)
+        for fii in fiis:
+            assert_audit_fields(fii, created_by_pk=test_user.pk)
+
+    def test_create_test_fii(self, db_session: Session, test_user: User):
+        """Test explicit arguments reach the created FII"""
+        # Act
+        fii = create_test_fii(
+            db_session, test_user.pk, tag="HELP11", name="Helper FII", sector="Lajes"
+        )
+
+        # Assert
+        row = db_session.execute(
+            select(Fii.tag, Fii.name, Fii.sector).where(Fii.pk == fii.pk)
+        ).one()
+        assert tuple(row) == ("HELP11", "Helper FII", "Lajes")
+
+
+class TestTransactionHelpers:
+    """Tests for bulk_create_test_transactions / create_test_transaction"""
+
+    def test_bulk_create_test_transactions_defaults(
+        self, db_session: Session, test_user: User, test_fii: Fii
+    ):
+        """Test default rows are 100-unit buys 30 days ago with a derived total"""
+        # Act
+        transactions = bulk_create_test_transactions(db_session, test_user.pk, test_fii.pk, 5)
+
+        # Assert
+        pks = [transaction.pk for transaction in transactions]
+        assert db_session.scalar(
+            select(func.count()).where(FiiTransaction.pk.in_(pks))
+        ) == 5
+        for transaction in transactions:
+            assert transaction.user_pk == test_user.pk
+            assert transaction.fii_pk == test_fii.pk
+            assert transaction.transaction_type == "buy"
+            assert transaction.quantity == 100
+            assert transaction.transaction_date == date.today() - timedelta(days=30)
+            assert transaction.total_amount == transaction.price_per_unit * 100
+
+    def test_create_test_transaction(self, db_session: Session, test_user: User, test_fii: Fii):
+        """Test explicit arguments override defaults and the derived total"""
+        # Act
+        derived = create_test_transaction(
+            db_session,
+            test_user.pk,
+            test_fii.pk,
+            transaction_type="sell",
+            quantity=3,
+            price_per_unit=Decimal("2.50"),
+        )
+        explicit = create_test_transaction(
+            db_session, test_user.pk, test_fii.pk, total_amount=Decimal("1.00")
+        )
+
+        # Assert
+        assert derived.transaction_type == "sell"
+        assert derived.total_amount == Decimal("7.50")
+        assert explicit.total_amount == Decimal("1.00")
+
+
+class TestDividendHelpers:
+    """Tests for bulk_create_test_dividends / create_test_dividend"""
+
+    def test_bulk_create_test_dividends_defaults(
+        self, db_session: Session, test_user: User, test_fii: Fii
+    ):
+        """Test default rows are paid 15 days ago for a 30-day-old reference date"""
+        # Act
+        dividends = bulk_create_test_dividends(db_session, test_user.pk, test_fii.pk, 4)
+
+        # Assert
+        pks = [dividend.pk for dividend in dividends]
+        assert db_session.scalar(select(func.count()).where(Dividend.pk.in_(pks))) == 4
+        for dividend in dividends:
+            assert dividend.payment_date == date.today() - timedelta(days=15)
+            assert dividend.reference_date == date.today() - timedelta(days=30)
+            assert Decimal("0.01") <= dividend.amount_per_unit <= Decimal("2.00")
+
+    def test_create_test_dividend(self, db_session: Session, test_user: User, test_fii: Fii):
+        """Test explicit arguments and extra columns reach the created dividend"""
+        # Act
+        dividend = create_test_dividend(
+            db_session,
+            test_user.pk,
+            test_fii.pk,
+            payment_date=date(2024, 3, 15),
+            amount_per_unit=Decimal("0.75"),
+            com_date=date(2024, 3, 10),
+        )
+
+        # Assert
+        row = db_session.execute(
+            select(Dividend.payment_date, Dividend.amount_per_unit, Dividend.com_date)
+            .where(Dividend.pk == dividend.pk)
+        ).one()
+        assert tuple(row) == (date(2024, 3, 15), Decimal("0.75"), date(2024, 3, 10))
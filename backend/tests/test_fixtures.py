@@ -0,0 +1,31 @@
+"""
+Tests for the shared test fixtures themselves.
+
+Tests for:
+- Seed data ordering relative to the per-test transaction
+"""
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.db.models.fii import Fii
+from app.db.models.user import User
+from tests.utils.test_helpers import create_test_fii
+
+
+class TestSeedData:
+    """Tests for session-scoped seed fixtures"""
+
+    def test_seed_fixture_requested_inside_open_transaction(
+        self, request: pytest.FixtureRequest, db_session: Session, test_user: User
+    ):
+        """Test seed fixtures can be requested after the test has written data"""
+        # Arrange: open the outer transaction with a write
+        create_test_fii(db_session, test_user.pk)
+
+        # Act
+        fii = request.getfixturevalue("another_test_fii")
+
+        # Assert
+        assert db_session.scalar(select(Fii.pk).where(Fii.pk == fii.pk)) == fii.pk
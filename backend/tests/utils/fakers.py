@@ -0,0 +1,83 @@
+"""
+Shared Faker instance for tests.
+
+Every test module and fixture imports `fake` from here instead of building its
+own `Faker("pt_BR")`, so the locale providers are loaded once per process.
+The generator is seeded, which makes generated data reproducible across runs.
+
+Faker calls go through locale/provider dispatch on every use, so the values
+fixtures need are generated once at import into fixed-size pools and picked
+round-robin. Columns with unique constraints get a process-wide counter value
+appended (tags are built from a counter alone), which keeps them unique
+without asking Faker for fresh values.
+"""
+
+import itertools
+from typing import TypeVar
+
+from faker import Faker
+
+T = TypeVar("T")
+
+# Brazilian Portuguese for realistic FII data; seeded with its own generator
+# so the pools below don't depend on other Faker instances' draws
+fake = Faker("pt_BR")
+fake.seed_instance(0)
+
+POOL_SIZE = 64
+FAKE_EMAILS = [fake.email() for _ in range(POOL_SIZE)]
+FAKE_USERNAMES = [fake.user_name() for _ in range(POOL_SIZE)]
+FAKE_NAMES = [fake.name() for _ in range(POOL_SIZE)]
+FAKE_COMPANIES = [fake.company() for _ in range(POOL_SIZE)]
+FAKE_PRICES = [
+    fake.pydecimal(left_digits=3, right_digits=2, positive=True)
+    for _ in range(POOL_SIZE)
+]
+FAKE_DIVIDEND_AMOUNTS = [
+    fake.pydecimal(left_digits=1, right_digits=2, positive=True, min_value=0.01, max_value=2.00)
+    for _ in range(POOL_SIZE)
+]
+
+_counter = itertools.count()
+_tag_counter = itertools.count()
+
+_BASE36_DIGITS = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+
+def pick(pool: list[T]) -> T:
+    """Return the next value from a fake data pool."""
+    return pool[next(_counter) % len(pool)]
+
+
+def unique_email() -> str:
+    """Return a pooled email made unique with a counter suffix."""
+    n = next(_counter)
+    local, domain = FAKE_EMAILS[n % POOL_SIZE].split("@")
+    return f"{local}{n}@{domain}"
+
+
+def unique_username() -> str:
+    """Return a pooled username made unique with a counter suffix."""
+    n = next(_counter)
+    return f"{FAKE_USERNAMES[n % POOL_SIZE]}{n}"
+
+
+def _base36(n: int) -> str:
+    """Format a non-negative integer in uppercase base 36."""
+    digits = ""
+    while True:
+        n, remainder = divmod(n, 36)
+        digits = _BASE36_DIGITS[remainder] + digits
+        if not n:
+            return digits
+
+
+def unique_tag() -> str:
+    """
+    Return a unique FII-style tag, e.g. "T000A711".
+
+    Built from a dedicated counter in base 36 rather than random letters, so
+    tags never collide (36**5 values before the width grows) and no Faker
+    call is needed.
+    """
+    return f"T{_base36(next(_tag_counter)):0>5}11"
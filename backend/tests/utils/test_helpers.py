@@ -5,20 +5,59 @@ This module provides helper functions for creating test data and asserting
 expected behaviors in tests.
 """
 
+import os
 from datetime import date, timedelta
+from contextlib import contextmanager
 from decimal import Decimal
-from typing import Any, Optional
-from faker import Faker
+from functools import lru_cache
+from operator import attrgetter, itemgetter
+from typing import Any, Callable, Iterator, Optional, TypeVar
+
+from pydantic import BaseModel, TypeAdapter
+from sqlalchemy import Engine, event, insert
 from sqlalchemy.orm import Session
 
 from app.core.security import get_password_hash
+from app.db.models.base import AuditMixin, SoftDeleteMixin
 from app.db.models.dividend import Dividend
 from app.db.models.fii import Fii
 from app.db.models.fii_transaction import FiiTransaction
 from app.db.models.user import User
+from tests.utils.fakers import (
+    FAKE_COMPANIES,
+    FAKE_DIVIDEND_AMOUNTS,
+    FAKE_NAMES,
+    FAKE_PRICES,
+    pick,
+    unique_email,
+    unique_tag,
+    unique_username,
+)
+
+ModelType = TypeVar("ModelType")
+
+
+def _batch_size_from_env() -> int:
+    """Rows per INSERT in bulk_insert: TEST_BULK_BATCH_SIZE, or 50 if unset."""
+    return int(os.environ.get("TEST_BULK_BATCH_SIZE", "50"))
+
 
-# Initialize Faker
-fake = Faker("pt_BR")
+# Read once at import; set TEST_BULK_BATCH_SIZE to tune it for a run
+BULK_BATCH_SIZE = _batch_size_from_env()
+
+
+# ============================================================================
+# DEFAULT DATES
+# ============================================================================
+
+def _default_dates(today: date) -> tuple[date, date, date]:
+    """Return (transaction date, payment date, reference date) defaults."""
+    return today - timedelta(days=30), today - timedelta(days=15), today - timedelta(days=30)
+
+
+# The date doesn't change within a normal run, so the helper defaults are
+# computed once at import
+_DEFAULT_TXN_DATE, _DEFAULT_PAY_DATE, _DEFAULT_REF_DATE = _default_dates(date.today())
 
 
 # ============================================================================
@@ -52,18 +91,17 @@ def create_test_user(
         User: Created user instance
     """
     user = User(
-        email=email or fake.email(),
-        username=username or fake.user_name(),
+        email=email or unique_email(),
+        username=username or unique_username(),
         hashed_password=get_password_hash(password),
-        full_name=full_name or fake.name(),
+        full_name=full_name or pick(FAKE_NAMES),
         is_active=is_active,
         is_superuser=is_superuser,
         **kwargs
     )
 
     db_session.add(user)
-    db_session.commit()
-    db_session.refresh(user)
+    _commit(db_session)
 
     # Store plain password for testing
     user.plain_password = password  # type: ignore
@@ -71,10 +109,143 @@ def create_test_user(
     return user
 
 
+# ============================================================================
+# BULK INSERT
+# ============================================================================
+
+# Session.info key set while a bulk_fixture_session block is open
+_DEFER_COMMIT = "test_helpers.defer_commit"
+
+
+@contextmanager
+def bulk_fixture_session(db_session: Session) -> Iterator[Session]:
+    """
+    Group many helper calls into one SAVEPOINT and a single commit.
+
+    Inside the block the create_* helpers only flush (so pks are assigned)
+    and skip their own commit and refresh; the whole block is committed once
+    on exit, or rolled back to the SAVEPOINT if it raises. Nested blocks
+    defer to the outermost one.
+
+    Usage:
+        with bulk_fixture_session(db_session):
+            fiis = [create_test_fii(db_session, user.pk) for _ in range(100)]
+
+    Args:
+        db_session: Database session
+
+    Yields:
+        The same session
+    """
+    if db_session.info.get(_DEFER_COMMIT):
+        yield db_session
+        return
+
+    db_session.info[_DEFER_COMMIT] = True
+    try:
+        with db_session.begin_nested():
+            yield db_session
+        db_session.commit()
+    finally:
+        del db_session.info[_DEFER_COMMIT]
+
+
+def _commit(db_session: Session) -> bool:
+    """
+    Commit unless inside bulk_fixture_session, where only a flush is done.
+
+    Returns:
+        True if the session was committed
+    """
+    if db_session.info.get(_DEFER_COMMIT):
+        db_session.flush()
+        return False
+
+    db_session.commit()
+    return True
+
+
+def bulk_insert(
+    db_session: Session,
+    model: type[ModelType],
+    rows: list[dict[str, Any]],
+    batch_size: Optional[int] = None,
+) -> list[ModelType]:
+    """
+    Insert rows in bulk with a single commit (deferred inside bulk_fixture_session).
+
+    Rows go out as multi-row INSERT ... RETURNING statements in batches of
+    `batch_size`, all inside the session's current transaction, so large
+    inputs neither build one huge statement nor pay per-row overhead. This
+    bypasses the ORM unit of work and returns loaded instances, so no
+    refresh() is needed.
+
+    Args:
+        db_session: Database session
+        model: Mapped model class to insert into
+        rows: Column values, one dict per row
+        batch_size: Rows per INSERT (default: BULK_BATCH_SIZE)
+
+    Returns:
+        List of created instances. Their order is not guaranteed to match
+        `rows` (batched RETURNING carries no ordering guarantee, and asking
+        for one makes SQLite fall back to one INSERT per row), so callers
+        match instances by column value rather than position.
+    """
+    if not rows:
+        return []
+
+    batch_size = batch_size or BULK_BATCH_SIZE
+    statement = insert(model).returning(model)
+
+    created: list[ModelType] = []
+    for start in range(0, len(rows), batch_size):
+        created.extend(db_session.scalars(statement, rows[start:start + batch_size]).all())
+    _commit(db_session)
+
+    return created
+
+
 # ============================================================================
 # FII HELPERS
 # ============================================================================
 
+def bulk_create_test_fiis(
+    db_session: Session,
+    user_pk: int,
+    count: int,
+    overrides: Optional[dict[str, Any]] = None,
+    batch_size: Optional[int] = None,
+) -> list[Fii]:
+    """
+    Create `count` test FIIs in batched INSERTs with one commit.
+
+    Args:
+        db_session: Database session
+        user_pk: User primary key for audit trail
+        count: Number of FIIs to create
+        overrides: Column values applied to every row (e.g. {"sector": "Shopping"})
+        batch_size: Rows per INSERT (default: BULK_BATCH_SIZE)
+
+    Returns:
+        list[Fii]: Created FII instances
+    """
+    overrides = overrides or {}
+    rows = [
+        {
+            "tag": unique_tag(),
+            "name": f"{pick(FAKE_COMPANIES)} FII",
+            "sector": "Logística",
+            "created_by_pk": user_pk,
+            "updated_by_pk": user_pk,
+            **overrides,
+        }
+        for _ in range(count)
+    ]
+
+    return bulk_insert(db_session, Fii, rows, batch_size)
+
+
 def create_test_fii(
     db_session: Session,
     user_pk: int,
@@ -97,26 +268,64 @@ def create_test_fii(
     Returns:
         Fii: Created FII instance
     """
-    fii = Fii(
-        tag=tag or fake.lexify(text="????11").upper(),
-        name=name or f"{fake.company()} FII",
-        sector=sector,
-        created_by_pk=user_pk,
-        updated_by_pk=user_pk,
-        **kwargs
-    )
-
-    db_session.add(fii)
-    db_session.commit()
-    db_session.refresh(fii)
+    overrides = {"sector": sector, **kwargs}
+    if tag is not None:
+        overrides["tag"] = tag
+    if name is not None:
+        overrides["name"] = name
 
-    return fii
+    return bulk_create_test_fiis(db_session, user_pk, 1, overrides)[0]
 
 
 # ============================================================================
 # TRANSACTION HELPERS
 # ============================================================================
 
+def bulk_create_test_transactions(
+    db_session: Session,
+    user_pk: int,
+    fii_pk: int,
+    count: int,
+    overrides: Optional[dict[str, Any]] = None,
+    batch_size: Optional[int] = None,
+) -> list[FiiTransaction]:
+    """
+    Create `count` test transactions in batched INSERTs with one commit.
+
+    Rows default to 100-unit buys dated 30 days ago at a random price;
+    total_amount is derived from quantity and price unless overridden.
+
+    Args:
+        db_session: Database session
+        user_pk: User primary key (owner)
+        fii_pk: FII primary key
+        count: Number of transactions to create
+        overrides: Column values applied to every row
+        batch_size: Rows per INSERT (default: BULK_BATCH_SIZE)
+
+    Returns:
+        list[FiiTransaction]: Created transaction instances
+    """
+    overrides = overrides or {}
+    rows = []
+    for _ in range(count):
+        row = {
+            "user_pk": user_pk,
+            "fii_pk": fii_pk,
+            "transaction_type": "buy",
+            "transaction_date": _DEFAULT_TXN_DATE,
+            "quantity": 100,
+            "price_per_unit": pick(FAKE_PRICES),
+            "created_by_pk": user_pk,
+            "updated_by_pk": user_pk,
+            **overrides,
+        }
+        row.setdefault("total_amount", row["price_per_unit"] * row["quantity"])
+        rows.append(row)
+
+    return bulk_insert(db_session, FiiTransaction, rows, batch_size)
+
+
 def create_test_transaction(
     db_session: Session,
     user_pk: int,
@@ -145,39 +354,64 @@ def create_test_transaction(
     Returns:
         FiiTransaction: Created transaction instance
     """
-    if price_per_unit is None:
-        price_per_unit = Decimal(fake.pydecimal(left_digits=3, right_digits=2, positive=True))
-
-    if total_amount is None:
-        total_amount = Decimal(quantity) * price_per_unit
-
-    if transaction_date is None:
-        transaction_date = date.today() - timedelta(days=30)
-
-    transaction = FiiTransaction(
-        user_pk=user_pk,
-        fii_pk=fii_pk,
-        transaction_type=transaction_type,
-        transaction_date=transaction_date,
-        quantity=quantity,
-        price_per_unit=price_per_unit,
-        total_amount=total_amount,
-        created_by_pk=user_pk,
-        updated_by_pk=user_pk,
-        **kwargs
-    )
+    overrides = {"transaction_type": transaction_type, "quantity": quantity, **kwargs}
+    if transaction_date is not None:
+        overrides["transaction_date"] = transaction_date
+    if price_per_unit is not None:
+        overrides["price_per_unit"] = price_per_unit
+    if total_amount is not None:
+        overrides["total_amount"] = total_amount
 
-    db_session.add(transaction)
-    db_session.commit()
-    db_session.refresh(transaction)
-
-    return transaction
+    return bulk_create_test_transactions(db_session, user_pk, fii_pk, 1, overrides)[0]
 
 
 # ============================================================================
 # DIVIDEND HELPERS
 # ============================================================================
 
+def bulk_create_test_dividends(
+    db_session: Session,
+    user_pk: int,
+    fii_pk: int,
+    count: int,
+    overrides: Optional[dict[str, Any]] = None,
+    batch_size: Optional[int] = None,
+) -> list[Dividend]:
+    """
+    Create `count` test dividends in batched INSERTs with one commit.
+
+    Rows default to a payment 15 days ago, a reference date 30 days ago and
+    a random amount per unit between 0.01 and 2.00.
+
+    Args:
+        db_session: Database session
+        user_pk: User primary key (owner)
+        fii_pk: FII primary key
+        count: Number of dividends to create
+        overrides: Column values applied to every row
+        batch_size: Rows per INSERT (default: BULK_BATCH_SIZE)
+
+    Returns:
+        list[Dividend]: Created dividend instances
+    """
+    overrides = overrides or {}
+    rows = [
+        {
+            "user_pk": user_pk,
+            "fii_pk": fii_pk,
+            "payment_date": _DEFAULT_PAY_DATE,
+            "reference_date": _DEFAULT_REF_DATE,
+            "amount_per_unit": pick(FAKE_DIVIDEND_AMOUNTS),
+            "created_by_pk": user_pk,
+            "updated_by_pk": user_pk,
+            **overrides,
+        }
+        for _ in range(count)
+    ]
+
+    return bulk_insert(db_session, Dividend, rows, batch_size)
+
+
 def create_test_dividend(
     db_session: Session,
     user_pk: int,
@@ -185,8 +419,6 @@ def create_test_dividend(
     payment_date: Optional[date] = None,
     reference_date: Optional[date] = None,
     amount_per_unit: Optional[Decimal] = None,
-    units_held: int = 100,
-    total_amount: Optional[Decimal] = None,
     **kwargs: Any
 ) -> Dividend:
     """
@@ -199,49 +431,29 @@ def create_test_dividend(
         payment_date: Payment date (default: 15 days ago)
         reference_date: Reference date (default: 30 days ago)
         amount_per_unit: Amount per unit (auto-generated if None)
-        units_held: Number of units held
-        total_amount: Total amount (auto-calculated if None)
         **kwargs: Additional fields to set on the dividend
 
     Returns:
         Dividend: Created dividend instance
     """
-    if payment_date is None:
-        payment_date = date.today() - timedelta(days=15)
-
-    if reference_date is None:
-        reference_date = date.today() - timedelta(days=30)
-
-    if amount_per_unit is None:
-        amount_per_unit = Decimal(fake.pydecimal(left_digits=1, right_digits=2, positive=True, min_value=0.01, max_value=2.00))
-
-    if total_amount is None:
-        total_amount = Decimal(units_held) * amount_per_unit
-
-    dividend = Dividend(
-        user_pk=user_pk,
-        fii_pk=fii_pk,
-        payment_date=payment_date,
-        reference_date=reference_date,
-        amount_per_unit=amount_per_unit,
-        units_held=units_held,
-        total_amount=total_amount,
-        created_by_pk=user_pk,
-        updated_by_pk=user_pk,
-        **kwargs
-    )
+    overrides = dict(kwargs)
+    if payment_date is not None:
+        overrides["payment_date"] = payment_date
+    if reference_date is not None:
+        overrides["reference_date"] = reference_date
+    if amount_per_unit is not None:
+        overrides["amount_per_unit"] = amount_per_unit
 
-    db_session.add(dividend)
-    db_session.commit()
-    db_session.refresh(dividend)
-
-    return dividend
+    return bulk_create_test_dividends(db_session, user_pk, fii_pk, 1, overrides)[0]
 
 
 # ============================================================================
 # ASSERTION HELPERS
 # ============================================================================
 
+# Assertion messages are only evaluated when the assertion fails, so the
+# f-strings below (type(obj).__name__ included) cost nothing on passing tests.
+
 def assert_audit_fields(
     obj: Any,
     created_by_pk: Optional[int],
@@ -261,10 +473,9 @@ def assert_audit_fields(
     if updated_by_pk is None:
         updated_by_pk = created_by_pk
 
-    assert hasattr(obj, "created_by_pk"), f"{type(obj).__name__} missing created_by_pk field"
-    assert hasattr(obj, "updated_by_pk"), f"{type(obj).__name__} missing updated_by_pk field"
-    assert hasattr(obj, "created_at"), f"{type(obj).__name__} missing created_at field"
-    assert hasattr(obj, "updated_at"), f"{type(obj).__name__} missing updated_at field"
+    # AuditMixin declares all four audit columns, so one isinstance check
+    # replaces a hasattr() per field
+    assert isinstance(obj, AuditMixin), f"{type(obj).__name__} has no audit fields"
 
     assert obj.created_by_pk == created_by_pk, \
         f"Expected created_by_pk={created_by_pk}, got {obj.created_by_pk}"
@@ -284,7 +495,7 @@ def assert_not_soft_deleted(obj: Any) -> None:
     Raises:
         AssertionError: If object is soft deleted (rm_timestamp is set)
     """
-    assert hasattr(obj, "rm_timestamp"), f"{type(obj).__name__} missing rm_timestamp field"
+    assert isinstance(obj, SoftDeleteMixin), f"{type(obj).__name__} missing rm_timestamp field"
     assert obj.rm_timestamp is None, f"{type(obj).__name__} should not be soft deleted"
 
 
@@ -298,7 +509,7 @@ def assert_soft_deleted(obj: Any) -> None:
     Raises:
         AssertionError: If object is NOT soft deleted (rm_timestamp is None)
     """
-    assert hasattr(obj, "rm_timestamp"), f"{type(obj).__name__} missing rm_timestamp field"
+    assert isinstance(obj, SoftDeleteMixin), f"{type(obj).__name__} missing rm_timestamp field"
     assert obj.rm_timestamp is not None, f"{type(obj).__name__} should be soft deleted"
     assert isinstance(obj.rm_timestamp, int), "rm_timestamp should be an integer (Unix epoch)"
     assert obj.rm_timestamp > 0, "rm_timestamp should be positive"
@@ -313,10 +524,10 @@ def assert_response_has_keys(response_data: dict, required_keys: list[str]) -> N
         required_keys: List of required key names
 
     Raises:
-        AssertionError: If any required key is missing
+        AssertionError: If any required key is missing (all missing keys are listed)
     """
-    for key in required_keys:
-        assert key in response_data, f"Response missing required key: {key}"
+    missing = set(required_keys) - response_data.keys()
+    assert not missing, f"Response missing required keys: {sorted(missing)}"
 
 
 def assert_response_excludes_keys(response_data: dict, excluded_keys: list[str]) -> None:
@@ -328,10 +539,36 @@ def assert_response_excludes_keys(response_data: dict, excluded_keys: list[str])
         excluded_keys: List of keys that should NOT be present
 
     Raises:
-        AssertionError: If any excluded key is found
+        AssertionError: If any excluded key is found (all found keys are listed)
+    """
+    present = response_data.keys() & set(excluded_keys)
+    assert not present, f"Response should not contain keys: {sorted(present)}"
+
+
+@lru_cache(maxsize=None)
+def _list_adapter(model: type[BaseModel]) -> TypeAdapter:
+    """Build (once per model) a TypeAdapter validating a list of `model`."""
+    return TypeAdapter(list[model])
+
+
+def assert_valid_list(response_data: Any, model: type[BaseModel]) -> list[BaseModel]:
+    """
+    Verify that a response is a list whose items all validate against a schema.
+
+    Validation runs in pydantic-core, so the structure and field types of every
+    item are checked in one call instead of key by key in Python.
+
+    Args:
+        response_data: Decoded JSON response
+        model: Pydantic response schema each item must satisfy
+
+    Returns:
+        List of validated schema instances
+
+    Raises:
+        pydantic.ValidationError: If the data is not a list or any item is invalid
     """
-    for key in excluded_keys:
-        assert key not in response_data, f"Response should not contain key: {key}"
+    return _list_adapter(model).validate_python(response_data)
 
 
 def assert_pagination_params(
@@ -355,6 +592,17 @@ def assert_pagination_params(
         f"{message} Expected {expected_length} items, got {actual_length}"
 
 
+def _field_getter(item: Any, field: str) -> Callable[[Any], Any]:
+    """
+    Return a C-level accessor for `field`, chosen once from a sample item.
+
+    Lists passed to the assertion helpers are homogeneous (all API dicts or
+    all model instances), so the dict-or-object dispatch is done up front
+    instead of per item.
+    """
+    return itemgetter(field) if isinstance(item, dict) else attrgetter(field)
+
+
 def assert_list_contains_only(
     items: list[Any],
     field: str,
@@ -373,12 +621,11 @@ def assert_list_contains_only(
     Raises:
         AssertionError: If any item has a different value
     """
-    for i, item in enumerate(items):
-        if isinstance(item, dict):
-            actual_value = item.get(field)
-        else:
-            actual_value = getattr(item, field, None)
+    if not items:
+        return
 
+    get = _field_getter(items[0], field)
+    for i, actual_value in enumerate(map(get, items)):
         assert actual_value == expected_value, \
             f"{message} Item {i}: expected {field}={expected_value}, got {actual_value}"
 
@@ -404,17 +651,56 @@ def assert_sorted_by(
     if len(items) < 2:
         return  # List of 0 or 1 items is always sorted
 
-    for i in range(len(items) - 1):
-        if isinstance(items[i], dict):
-            current_value = items[i].get(field)
-            next_value = items[i + 1].get(field)
-        else:
-            current_value = getattr(items[i], field)
-            next_value = getattr(items[i + 1], field)
+    values = list(map(_field_getter(items[0], field), items))
+    if values == sorted(values, reverse=descending):
+        return
 
+    # Only on failure: walk the pairs to report the first out-of-order index
+    for i, (current_value, next_value) in enumerate(zip(values, values[1:])):
         if descending:
             assert current_value >= next_value, \
                 f"{message} Items not sorted descending by {field}: {current_value} < {next_value} at index {i}"
         else:
             assert current_value <= next_value, \
                 f"{message} Items not sorted ascending by {field}: {current_value} > {next_value} at index {i}"
+
+
+# Transaction control emitted by the SAVEPOINT-based test isolation; not
+# part of the work an endpoint does, so it is left out of query counts
+_TRANSACTION_CONTROL = ("BEGIN", "COMMIT", "ROLLBACK", "SAVEPOINT", "RELEASE")
+
+
+class QueryCounter:
+    """
+    Context manager recording the SQL statements an engine executes.
+
+    Every statement sent through the engine while the block runs is recorded
+    (including those issued by the API under test), except transaction control.
+
+    Usage:
+        with QueryCounter(engine) as counter:
+            ...
+        assert counter.count == 3
+    """
+
+    def __init__(self, engine: Engine):
+        self.engine = engine
+        self.statements: list[str] = []
+
+    @property
+    def count(self) -> int:
+        """Number of statements recorded so far."""
+        return len(self.statements)
+
+    def _record(self, conn, cursor, statement, parameters, context, executemany):
+        if not statement.lstrip().upper().startswith(_TRANSACTION_CONTROL):
+            self.statements.append(statement)
+
+    def __enter__(self):
+        self.statements.clear()
+        event.listen(self.engine, "before_cursor_execute", self._record)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        event.remove(self.engine, "before_cursor_execute", self._record)
+        return False